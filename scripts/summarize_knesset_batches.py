@@ -58,7 +58,7 @@ from utils.meeting import (
 )
 from summarization.pipeline import _build_attendance_block
 from summarization.prompts import SYSTEM_PROMPT_BATCH_PASS1, SYSTEM_PROMPT_BATCH_CONTINUATION
-from utils.knesset_db import get_mk_profile
+from utils.knesset_db import _most_recent_faction, get_mk_profile
 
 # ── Batch constants ───────────────────────────────────────────────────────────
 
@@ -157,16 +157,12 @@ def _enrich_summary_attendance(text: str, knesset_num: int) -> str:
             replacements[full_match] = full_match
             continue
 
-        factions = [
-            f for f in (profile.get("factions") or [])
-            if f and f.get("knesset") == knesset_num
-        ]
-        faction = max(factions, key=lambda f: f.get("start_date") or "", default=None)
+        factions = profile.get("factions") or ()
+        faction = _most_recent_faction(factions, knesset_num)
         if not faction:
             # Fallback: use most recent faction from any knesset (handles MKs whose
             # API record lists them under a slightly different knesset number).
-            all_factions = [f for f in (profile.get("factions") or []) if f]
-            faction = max(all_factions, key=lambda f: f.get("start_date") or "", default=None)
+            faction = _most_recent_faction(factions, None)
         if not faction:
             replacements[full_match] = full_match
             continue
@@ -50,6 +50,31 @@ def _convert_tools_genai(tools: list[dict]) -> list[types.Tool] | None:
     return [types.Tool(function_declarations=declarations)] if declarations else None
 
 
+# Tool lists are built once (summarization TOOLS at import, the executor's
+# schemas once per step) and then re-sent unchanged on every turn. Keep the
+# converted Tool objects for the last few lists instead of re-validating the
+# same schemas on each call. An entry holds its list, so the id() key cannot
+# be reused by another object while it is cached.
+_GENAI_TOOLS_CACHE: dict[int, tuple[list[dict], list[types.Tool] | None]] = {}
+_GENAI_TOOLS_CACHE_SIZE = 8
+_GENAI_TOOLS_LOCK = threading.Lock()
+
+
+def _genai_tools(tools: list[dict]) -> list[types.Tool] | None:
+    """`_convert_tools_genai`, memoized on the identity of the `tools` list."""
+    key = id(tools)
+    with _GENAI_TOOLS_LOCK:
+        hit = _GENAI_TOOLS_CACHE.get(key)
+        if hit is not None and hit[0] is tools:
+            return hit[1]
+    converted = _convert_tools_genai(tools)
+    with _GENAI_TOOLS_LOCK:
+        if key not in _GENAI_TOOLS_CACHE and len(_GENAI_TOOLS_CACHE) >= _GENAI_TOOLS_CACHE_SIZE:
+            _GENAI_TOOLS_CACHE.pop(next(iter(_GENAI_TOOLS_CACHE)))
+        _GENAI_TOOLS_CACHE[key] = (tools, converted)
+    return converted
+
+
 def _build_tool_call_map(messages: list[dict]) -> dict[str, str]:
     """Build tool_call_id → function_name map from assistant messages."""
     mapping: dict[str, str] = {}
@@ -357,7 +382,7 @@ class GoogleBackend(LLMBackend):
             max_output_tokens  = max_tokens,
             temperature        = temperature if temperature is not None else self.TEMPERATURE,
             system_instruction = system_text,
-            tools              = _convert_tools_genai(tools) if tools else None,
+            tools              = _genai_tools(tools) if tools else None,
             thinking_config    = thinking_config,
         )
 
@@ -15,7 +15,8 @@ This module is the §12 migration shim that bridges the two:
     JSON-schema list.
   * :func:`call_for_machine_runner` invokes :func:`utils.tools.dispatch`
     and serialises the returned :class:`ToolEnvelope` back to the JSON
-    string the legacy runner expects.
+    string the legacy runner expects; :func:`call_many_for_machine_runner`
+    does the same for every tool call of a turn, concurrently.
 
 This module is registry-agnostic; the caller (typically
 ``scripts/run_web.py`` when ``KNESSET_MACHINE`` points at the legacy
@@ -26,7 +27,9 @@ from __future__ import annotations
 
 import json
 
-from utils.tools import ToolRegistry, dispatch
+from agent.subgraph.evidence import ToolEnvelope
+from utils.tool_helpers.serialize import dumps as dumps_payload
+from utils.tools import ToolRegistry, dispatch, dispatch_many
 
 
 # ---------------------------------------------------------------------------
@@ -76,7 +79,7 @@ def call_for_machine_runner(
 
     The legacy runner shoves the return value of a tool call straight into
     a ``role="tool"`` message, which the OpenAI tool-call API requires to
-    be a string.  We ``json.dumps`` the envelope's ``to_dict()`` shape so
+    be a string.  We serialise the envelope's ``to_dict()`` shape so
     the LLM sees every field (summary, full, metadata, provenance,
     truncated, error) and can reason about errors / warnings the same way
     the plan-execute executor does.
@@ -85,9 +88,25 @@ def call_for_machine_runner(
     path through the envelope's ``error`` field, and the JSON serialisation
     falls back to ``default=str`` for any stragglers.
     """
-    envelope = dispatch(registry, name, args or {})
+    return _legacy_json(dispatch(registry, name, args or {}), name)
+
+
+def call_many_for_machine_runner(
+    registry: ToolRegistry,
+    calls: list[tuple[str, dict]],
+) -> list[str]:
+    """:func:`call_for_machine_runner` for all tool calls of one model turn.
+
+    The calls run concurrently via :func:`utils.tools.dispatch_many`;
+    results come back in call order, so they pair with their tool_call ids.
+    """
+    envelopes = dispatch_many(registry, [(name, args or {}) for name, args in calls])
+    return [_legacy_json(env, name) for env, (name, _args) in zip(envelopes, calls)]
+
+
+def _legacy_json(envelope: ToolEnvelope, name: str) -> str:
     try:
-        return json.dumps(envelope.to_dict(), ensure_ascii=False, default=str)
+        return dumps_payload(envelope.to_dict())
     except Exception:  # noqa: BLE001 — final safety net for the legacy contract
         return json.dumps(
             {
@@ -105,4 +124,5 @@ def call_for_machine_runner(
 __all__ = [
     "list_tools_for_machine_runner",
     "call_for_machine_runner",
+    "call_many_for_machine_runner",
 ]
@@ -15,11 +15,22 @@ DATA_DIR  = _SRC_DIR.parent.parent / "Data"   # KnessetLM/Data/
 OKNESSET_API             = "https://backend.oknesset.org"
 OFFICIAL_KNESSET_NEW_API = "https://knesset.gov.il/OdataV4/ParliamentInfo"
 API_TIMEOUT = 30
+API_MAX_PARALLEL_REQUESTS = 8   # worker threads for concurrent Knesset API requests
+BILL_DOC_MAX_BYTES     = 16 * 1024 * 1024   # bill PDFs larger than this are skipped
+PROTOCOL_DOC_MAX_BYTES = 128 * 1024 * 1024  # session protocols (full transcripts) — memory guard only
 
 # ── HTTP cache ────────────────────────────────────────────────────────────────
 
 CACHE_DB  = DATA_DIR / "knesset_api_cache"
 CACHE_TTL = 7 * 24 * 3600   # 1 week (seconds)
+# knesset_db's own HTTP cache — per-URL expiry (COMMITTEE_CACHE_TTL, else uncached),
+# kept apart from CACHE_DB so it never shares a backend with utils.cache.SESSION
+KNESSET_DB_CACHE_DB = DATA_DIR / "knesset_db_http_cache"
+MEMBERS_CACHE_TTL = 10 * 60  # in-process MK list cache; revalidated (ETag) after this (seconds)
+MEMBERS_CACHE_DIR = DATA_DIR / "members_cache"  # last /members download + validators, across processes
+BILL_DOCS_CACHE_DIR = DATA_DIR / "bill_docs_cache"  # extracted bill text, one file per URL hash
+BILL_DOCS_CACHE_TTL = 7 * 24 * 3600  # bill text files older than this are re-downloaded (seconds)
+COMMITTEE_CACHE_TTL = 10 * 60  # knesset_db HTTP cache for committee lists/members (seconds)
 
 # ── LLM ──────────────────────────────────────────────────────────────────────
 
@@ -157,6 +168,7 @@ KEYWORD_RERANK_TOP_K               = 200    # cosine rerank window when sort=rel
 NAME_RESOLUTION_AUTO_THRESHOLD     = 0.35
 FUZZY_SEARCH_THRESHOLD             = 55.0   # minimum RapidFuzz score (0–100) to include a candidate
 FUZZY_BODY_SCORE_WEIGHT            = 0.85   # body match weighted lower than label match
+MK_NAME_FUZZY_THRESHOLD            = 80.0   # min partial_ratio (0–100) for MK name typo fallback
 
 # Bill text
 BILL_TEXT_DEFAULT_MAX_CHARS  = 1000
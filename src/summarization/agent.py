@@ -11,15 +11,11 @@ import json
 from agent.llm.base import DoneEvent, LLMBackend, ThinkingEvent, TokenEvent, ToolCallsEvent
 from agent.llm.google import GoogleBackend
 from agent.research_agent.tools import RESEARCH_TOOL_REGISTRY
-from agent.tools import call_for_machine_runner, list_tools_for_machine_runner
+from agent.tools import call_many_for_machine_runner, list_tools_for_machine_runner
 
 TOOLS = list_tools_for_machine_runner(RESEARCH_TOOL_REGISTRY)
 
 
-def dispatch(name: str, args: dict) -> str:
-    return call_for_machine_runner(RESEARCH_TOOL_REGISTRY, name, args)
-
-
 def run_agent_loop(
     messages:   list[dict],
     max_rounds: int        = 30,
@@ -85,13 +81,17 @@ def run_agent_loop(
             continue
 
         messages.append({"role": "assistant", "content": clean_content, "tool_calls": tool_calls})
+        calls = []
         for tc in tool_calls:
             tool_call_count += 1
             fn_name = tc["function"]["name"]
             fn_args = json.loads(tc["function"]["arguments"])
             if not quiet:
                 print(f"🔧 Tool [{tool_call_count}]: {fn_name}({json.dumps(fn_args, ensure_ascii=False)})")
-            result = dispatch(fn_name, fn_args)
+            calls.append((fn_name, fn_args))
+        # The calls of one turn are independent — run them concurrently
+        results = call_many_for_machine_runner(RESEARCH_TOOL_REGISTRY, calls)
+        for tc, result in zip(tool_calls, results):
             if not quiet:
                 print(f"   ↳ {result[:200]}{'...' if len(result) > 200 else ''}\n")
             messages.append({"role": "tool", "tool_call_id": tc["id"], "content": result})
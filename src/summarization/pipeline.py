@@ -11,22 +11,18 @@ from agent.llm.base import LLMBackend
 from summarization.agent import run_agent_loop
 from summarization.prompts import SYSTEM_PROMPT_PASS1, SYSTEM_PROMPT_CONTINUATION
 from utils.meeting import load_meeting, build_transcript_text, chunk_transcript, extract_attendance
-from utils.knesset_db import get_mk_profile, get_committee_members
+from utils.knesset_db import _most_recent_faction, get_mk_profile, get_committee_members
 from config import summaries_dir, CHARS_PER_TOK, MAX_CHUNK_CHARS, MAX_SUMMARIZATION_CHUNKS, NOT_PROTOCOL
 
 
 def _mk_line(profile: dict, knesset_num: int, duty_desc: str = "") -> str:
     """Format a single MK profile as a bulleted attendance line with party and optional role."""
-    factions = [
-        f for f in (profile.get("factions") or [])
-        if f and f.get("knesset") == knesset_num
-    ]
-    faction = max(factions, key=lambda f: f.get("start_date") or "", default=None)
+    factions = profile.get("factions") or ()
+    faction = _most_recent_faction(factions, knesset_num)
     if not faction:
         # Fallback: most recent faction from any knesset (MK may be recorded under
         # a different knesset number in the API).
-        all_factions = [f for f in (profile.get("factions") or []) if f]
-        faction = max(all_factions, key=lambda f: f.get("start_date") or "", default=None)
+        faction = _most_recent_faction(factions, None)
     party = faction["faction_name"] if faction else ""
     first = profile.get("mk_individual_first_name", "")
     last  = profile.get("mk_individual_name", "")
@@ -20,17 +20,30 @@ Usage:
     from utils.knesset_db import get_mk_profile, get_all_mks, get_all_parties
 """
 
+import atexit
+import hashlib
 import os
+import threading
 import time
+from datetime import date, timedelta
 import requests
+import requests_cache
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
 import io
 import pdfplumber
 import fitz  # pymupdf
 import re
 import docx          # python-docx
 from bs4 import BeautifulSoup
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
 
 try:
     import win32com.client as _win32com
@@ -38,7 +51,14 @@ try:
 except ImportError:
     _WORD_COM_AVAILABLE = False
 
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
 import config as _config
+from utils.tool_helpers.serialize import dumps_bytes as _json_dumps_bytes, loads as _json_loads
 
 OKNESSET_API = "https://backend.oknesset.org"
 OFFICIAL_KNESSET_NEW_API = "https://knesset.gov.il/OdataV4/ParliamentInfo"
@@ -46,6 +66,10 @@ TIMEOUT = 60
 
 SESSION_TYPE_CLASSIFIED  = 160  # חסויה — classified session; no public transcript
 _PROTOCOL_NAME_SUBSTRINGS = ("פרוטוקול", "protocol")
+_DUTY_ACTING = 'מ"מ'   # ממלא מקום — acting/substitute committee role
+_DUTY_CHAIR  = 'יו"ר'  # יושב ראש — committee chair
+# Official committee names open with one of these ("ועדת הכספים", "הוועדה לביקורת המדינה")
+_COMMITTEE_NAME_PREFIXES = ("ועדת ", "הוועדה ", "ועדה ")
 
 _DOC_GROUP_PRIORITY = [
     "הצעת חוק לקריאה השנייה והשלישית",
@@ -53,19 +77,66 @@ _DOC_GROUP_PRIORITY = [
     "טקסט חוק מאוחד",
     "חוק - פרסום ברשומות",
 ]
+_DOC_GROUP_RANK = {desc: i for i, desc in enumerate(_DOC_GROUP_PRIORITY)}
 _HEBREW_DATE_RE = re.compile(r',?\s*ה?תש[\u05d0-\u05ea]{1,3}["\u05f3][\u05d0-\u05ea](?:[–\-]\d{4})?')
 _BILL_TYPE_PREFIXES = ('הצעת חוק', 'חוק', 'תיקון לחוק')
-
-
+# OData $select projections — only the fields the record builders below read
+_BILL_SELECT      = "Id,Name,Number,KnessetNum,TypeDesc,SubTypeDesc,CommitteeID,PublicationDate,LastUpdatedDate"
+_PERSON_SELECT    = "KNS_Person($select=Id,FirstName,LastName)"
+_VOTE_SELECT      = "Id,VoteTitle,VoteSubject,VoteDateTime,VoteMethodDesc,IsNoConfidenceInGov"
+_DOCUMENT_SELECT  = "Id,ApplicationDesc,FilePath"
+_COMMITTEE_MEMBER_EXPAND = "KNS_Person($select=FirstName,LastName),KNS_Position($select=Description)"
+# Niqqud/cantillation, geresh/gershayim, bidi marks, whitespace and punctuation —
+# stripped from MK names and queries so spelling/formatting variants compare equal
+_NAME_NOISE_RE = re.compile(r'[\u0591-\u05C7\u05F3\u05F4\u200e\u200f\s\-"\'.,]+')
+# Word boundaries inside a name: whitespace, hyphen, maqaf
+_NAME_WORD_SPLIT_RE = re.compile(r'[\s\-\u05BE]+')
+
+
+# ── HTTP session ─────────────────────────────────────────────────────────────
+# One pooled session for every request in this module, so consecutive calls to
+# backend.oknesset.org / knesset.gov.il reuse a kept-alive TLS connection
+# instead of paying a fresh TCP + TLS handshake each time.
+# Retries stay in _retry_get (config-driven), so the adapter does not retry.
+# Committee lists and memberships change rarely and are re-requested with the
+# same arguments throughout a session, so those responses are kept in the
+# on-disk HTTP cache (KNESSET_DB_CACHE_DB) for COMMITTEE_CACHE_TTL; every other
+# URL bypasses it (member lists have their own TTL + ETag revalidation, see
+# _fetch_members).
+
+_SESSION = requests_cache.CachedSession(
+    str(_config.KNESSET_DB_CACHE_DB),
+    backend="sqlite",
+    expire_after=requests_cache.DO_NOT_CACHE,
+    urls_expire_after={
+        f"{OKNESSET_API}/committees_kns_committee/*":           _config.COMMITTEE_CACHE_TTL,
+        # regex: a KNS_Committee glob would also match KNS_CommitteeSession
+        re.compile(re.escape(f"{OFFICIAL_KNESSET_NEW_API}/KNS_Committee") + r"(?:\?|$)"):
+                                                                _config.COMMITTEE_CACHE_TTL,
+        f"{OFFICIAL_KNESSET_NEW_API}/KNS_PersonToPosition*":    _config.COMMITTEE_CACHE_TTL,
+    },
+    allowable_methods=("GET",),
+)
+_SESSION.headers["User-Agent"] = f"knesset-lm {requests.utils.default_user_agent()}"
+atexit.register(_SESSION.close)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Worker pool for overlapping independent requests over _SESSION
+# (urllib3's connection pool is thread-safe). Tasks submitted here must be
+# leaf requests: a task that itself waits on _POOL can starve the pool.
+_POOL = ThreadPoolExecutor(
+    max_workers=_config.API_MAX_PARALLEL_REQUESTS,
+    thread_name_prefix="knesset_db",
+)
 
 
 # ── Retry helper ─────────────────────────────────────────────────────────────
 
 def _retry_get(url: str, **kwargs) -> requests.Response:
     """
-    requests.get with retry on transient network errors.
-    Retries on ConnectionError, Timeout, and HTTP 5xx.
-    4xx responses are returned as-is for the caller to handle.
+    _SESSION.get with retry on transient network errors.
+    Retries on ConnectionError, Timeout, HTTP 429 and HTTP 5xx.
+    Other 4xx responses are returned as-is for the caller to handle.
     """
     attempts = _config.API_RETRY_ATTEMPTS
     sleep    = _config.API_RETRY_SLEEP
@@ -73,9 +144,10 @@ def _retry_get(url: str, **kwargs) -> requests.Response:
 
     for i in range(attempts):
         try:
-            r = requests.get(url, **kwargs)
-            if r.status_code < 500:
+            r = _SESSION.get(url, **kwargs)
+            if r.status_code < 500 and r.status_code != 429:
                 return r
+            r.close()  # release a streamed connection before retrying
             last_exc = requests.exceptions.HTTPError(
                 f"HTTP {r.status_code}", response=r
             )
@@ -93,45 +165,221 @@ def _retry_get(url: str, **kwargs) -> requests.Response:
     raise last_exc  # type: ignore[misc]
 
 
+def _json(response: requests.Response):
+    """Decode a JSON response body (orjson when installed, see utils.tool_helpers.serialize)."""
+    return _json_loads(response.content)
+
+
+def _download_document(url: str, limit: int) -> bytes:
+    """
+    Download a bill/protocol document, streamed so that a file over `limit`
+    bytes (BILL_DOC_MAX_BYTES / PROTOCOL_DOC_MAX_BYTES) is abandoned — by
+    Content-Length, or once the body passes the cap — instead of being
+    buffered whole. A cut-off PDF has no xref table to parse, so oversized
+    documents raise ValueError rather than returning a prefix; callers log
+    it and move on to the next document.
+    """
+    with _retry_get(url, timeout=TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        declared = response.headers.get("Content-Length", "")
+        if declared.isdigit() and int(declared) > limit:
+            raise ValueError(f"document is {declared} bytes (limit {limit})")
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body += chunk
+            if len(body) > limit:
+                raise ValueError(f"document exceeds {limit} bytes")
+    return bytes(body)
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# is_current → (conditional-request headers, members) from the last full download
+_members_validators: dict[bool, tuple[dict[str, str], list[dict]]] = {}
+# monotonic time of the last members request; 0.0 when nothing is cached
+_members_fetched_at: float = 0.0
+
+
+def _members_cache_path(is_current: bool) -> Path:
+    """On-disk copy of the last /members download for one is_current value."""
+    return _config.MEMBERS_CACHE_DIR / f"members_{'current' if is_current else 'former'}.json"
+
+
+def _load_members_from_disk(is_current: bool) -> tuple[dict[str, str], list[dict]] | None:
+    """(validators, members) saved by an earlier process, or None if absent/unreadable."""
+    try:
+        raw = _members_cache_path(is_current).read_bytes()
+        cached = _json_loads(raw)
+        return cached["validators"], cached["members"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache_file(path: Path, data: bytes) -> None:
+    """
+    Write a disk-cache file atomically (temp file + os.replace), so concurrent
+    readers never see a partial file. Failures only log — the cache is optional.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"[knesset_db] could not write cache file {path} ({exc})", flush=True)
+
+
+def _save_members_to_disk(is_current: bool, validators: dict[str, str], members: list[dict]) -> None:
+    """Persist a /members download and its validators for the next process."""
+    payload = {"validators": validators, "members": members}
+    _write_cache_file(
+        _members_cache_path(is_current),
+        _json_dumps_bytes(payload),
+    )
+
+
 @lru_cache(maxsize=2)
 def _fetch_members(is_current: bool) -> list[dict]:
     """
     Fetch all members from the oknesset API.
-    Cached per session — current and former are cached separately.
+    Cached per session — current and former are cached separately — until
+    MEMBERS_CACHE_TTL passes (see _expire_stale_members). A refresh sends the
+    stored ETag / Last-Modified, so an unchanged list costs a 304 rather than
+    a re-download; the last download is also kept under MEMBERS_CACHE_DIR,
+    so a fresh process starts with a conditional request too.
     """
+    global _members_fetched_at
     url    = f"{OKNESSET_API}/members"
     params = {"is_current": "true" if is_current else "false"}
-    response = _retry_get(url, params=params, timeout=TIMEOUT)
+    known  = _members_validators.get(is_current) or _load_members_from_disk(is_current)
+    headers = dict(known[0]) if known else {}
+    response = _retry_get(url, params=params, headers=headers, timeout=TIMEOUT)
+    _members_fetched_at = time.monotonic()
+    if response.status_code == 304 and known:
+        _members_validators[is_current] = known
+        return known[1]
     response.raise_for_status()
-    return response.json()
+    members = _json(response)
+    validators = {
+        header: value
+        for header, value in (("If-None-Match",     response.headers.get("ETag")),
+                              ("If-Modified-Since", response.headers.get("Last-Modified")))
+        if value
+    }
+    if validators:
+        _members_validators[is_current] = (validators, members)
+        _save_members_to_disk(is_current, validators, members)
+    return members
 
 
-def _get_all_members_raw(knesset_num: int = 25) -> list[dict]:
-    """Return all members (current + former) filtered to a given Knesset."""
-    current = _fetch_members(True)
-    former  = _fetch_members(False)
-    all_members = current + former
+def _prefetch_members() -> tuple[list[dict], list[dict]]:
+    """
+    Return (current, former) member lists, fetching both concurrently.
+    On a cold cache the two downloads overlap; afterwards both are lru_cache hits.
+    """
+    current_f = _POOL.submit(_fetch_members, True)
+    former_f  = _POOL.submit(_fetch_members, False)
+    return current_f.result(), former_f.result()
+
+
+@lru_cache(maxsize=1)
+def _combined_members() -> list[dict]:
+    """All members, current first then former — concatenated once, not per call."""
+    current, former = _prefetch_members()
+    return current + former
+
+
+@lru_cache(maxsize=1)
+def _mk_by_id() -> dict[str, dict]:
+    """
+    Lookup of every member by mk_individual_id and by PersonID (as strings).
+    A current record wins over a former one with the same id.
+    """
+    lookup: dict[str, dict] = {}
+    for mk in _combined_members():
+        for key in (mk.get("mk_individual_id"), mk.get("PersonID")):
+            if key:
+                lookup.setdefault(str(key), mk)
+    return lookup
 
+
+@lru_cache(maxsize=1)
+def _members_by_knesset() -> dict[int, list[dict]]:
+    """
+    Members bucketed by every Knesset they had a faction in — one pass over
+    all members per fetch, keeping member order (current first) in each bucket.
+    """
+    by_knesset: defaultdict[int, list[dict]] = defaultdict(list)
+    for mk in _combined_members():
+        for knesset in {f.get("knesset") for f in mk.get("factions") or () if f}:
+            by_knesset[knesset].append(mk)
+    return dict(by_knesset)
+
+
+def _get_all_members_raw(knesset_num: int = 25) -> list[dict]:
+    """
+    Return all members (current + former) filtered to a given Knesset.
+    Served from the cached indexes — callers must not mutate the returned list.
+    """
     if knesset_num is None:
-        return all_members
-
-    # Keep only members who had a faction in the requested Knesset
-    result = []
-    for mk in all_members:
-        factions = [f for f in (mk.get("factions") or []) if f and f.get("knesset") == knesset_num]
-        if factions:
-            result.append(mk)
-    return result
+        return _combined_members()
+    return _members_by_knesset().get(knesset_num, [])
 
 
-def _most_recent_faction(factions: list[dict], knesset_num: int) -> dict | None:
-    """From a list of faction records, return the most recent one for a given Knesset."""
-    relevant = [f for f in factions if f and f.get("knesset") == knesset_num]
-    if not relevant:
-        return None
-    return max(relevant, key=lambda f: f.get("start_date") or "")
+def _most_recent_faction(factions: list[dict], knesset_num: int | None) -> dict | None:
+    """
+    From a list of faction records, return the most recent one for a given Knesset
+    (any Knesset when knesset_num is None). Skips empty records itself, so callers
+    pass mk["factions"] as-is; filter and max run in one pass (first wins on ties).
+    """
+    best, best_start = None, ""
+    for f in factions:
+        if not f or (knesset_num is not None and f.get("knesset") != knesset_num):
+            continue
+        start = f.get("start_date") or ""
+        if best is None or start > best_start:
+            best, best_start = f, start
+    return best
+
+
+@dataclass(frozen=True, slots=True)
+class _PartyMember:
+    """One roster entry — slotted and frozen, so the cached rosters stay compact and read-only."""
+
+    mk_id: str
+    full_name: str
+    is_current: bool
+
+    def to_dict(self) -> dict:
+        return {"mk_id": self.mk_id, "full_name": self.full_name, "is_current": self.is_current}
+
+
+def _mk_full_name(mk: dict) -> str:
+    """"First Last" for a raw member record (either part may be missing)."""
+    return f"{mk.get('mk_individual_first_name') or ''} {mk.get('mk_individual_name') or ''}".strip()
+
+
+@lru_cache(maxsize=8)
+def _party_rosters(knesset_num: int = 25) -> dict[str, tuple[_PartyMember, ...]]:
+    """
+    Members of each party in a given Knesset, by their most recent faction there.
+    Built once per knesset_num — parties in first-seen order, members sorted
+    by full_name. Public callers get plain dicts via _PartyMember.to_dict().
+    """
+    rosters: dict[str, list[_PartyMember]] = defaultdict(list)
+    for mk in _get_all_members_raw(knesset_num):
+        faction = _most_recent_faction(mk.get("factions") or (), knesset_num)
+        if not faction:
+            continue
+        rosters[faction["faction_name"].strip()].append(_PartyMember(
+            mk_id=str(mk.get("mk_individual_id") or ""),
+            full_name=_mk_full_name(mk),
+            is_current=bool(mk.get("IsCurrent", False)),
+        ))
+    return {
+        party: tuple(sorted(members, key=lambda m: m.full_name))
+        for party, members in rosters.items()
+    }
 
 
 def _fix_file_path(path: str) -> str:
@@ -150,44 +398,55 @@ def _is_garbage(text: str, threshold: float = 0.3) -> bool:
     return (garbage_count / len(text)) > threshold
 
 
-def _extract_pdf_text_pymupdf(pdf_bytes: bytes) -> str:
+def _extract_pdf_text_pymupdf(pdf_bytes: bytes, max_chars: int | None = None) -> str:
     """
     Extract text from a PDF using PyMuPDF (fitz).
     Handles more Hebrew font encodings than pdfplumber.
+    Stops reading pages once the text exceeds max_chars (when given).
     """
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     pages = []
-    for page in doc:
-        text = page.get_text("text")
-        if text:
-            pages.append(text)
-    doc.close()
+    total = 0
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc:
+            text = page.get_text("text")
+            if text:
+                pages.append(text)
+                total += len(text) + 1
+                if max_chars is not None and total > max_chars:
+                    break
     return "\n".join(pages).strip()
 
 
-def _extract_pdf_text_pdfplumber(pdf_bytes: bytes) -> str:
+def _extract_pdf_text_pdfplumber(pdf_bytes: bytes, max_chars: int | None = None) -> str:
     """
     Extract text from a PDF using pdfplumber (pdfminer backend).
+    Pages are laid out lazily, so stopping at max_chars skips the rest.
     """
     with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
         pages = []
+        total = 0
         for page in pdf.pages:
             text = page.extract_text(x_tolerance=2, y_tolerance=2)
             if text:
                 pages.append(text)
+                total += len(text) + 1
+                if max_chars is not None and total > max_chars:
+                    break
     return "\n".join(pages).strip()
 
 
-def _extract_pdf_text(pdf_bytes: bytes) -> str:
+def _extract_pdf_text(pdf_bytes: bytes, max_chars: int | None = None) -> str:
     """
     Extract Hebrew text from a PDF, trying multiple engines.
     PyMuPDF first (faster, handles more font encodings).
     Falls back to pdfplumber if the result is garbage.
     Returns empty string if all methods fail.
+    With max_chars, page extraction stops once the text is longer than that,
+    so callers slicing to max_chars can still tell whether it was truncated.
     """
     # Try PyMuPDF first
     try:
-        text = _extract_pdf_text_pymupdf(pdf_bytes)
+        text = _extract_pdf_text_pymupdf(pdf_bytes, max_chars)
         if text and not _is_garbage(text):
             return text
     except Exception as exc:
@@ -195,7 +454,7 @@ def _extract_pdf_text(pdf_bytes: bytes) -> str:
 
     # Fall back to pdfplumber
     try:
-        text = _extract_pdf_text_pdfplumber(pdf_bytes)
+        text = _extract_pdf_text_pdfplumber(pdf_bytes, max_chars)
         if text and not _is_garbage(text):
             return text
     except Exception as exc:
@@ -204,12 +463,21 @@ def _extract_pdf_text(pdf_bytes: bytes) -> str:
     return ""
 
 
+def _odata_quote(value: str) -> str:
+    """
+    Escape a value for use inside an OData string literal ('...'):
+    single quotes (also used as geresh, e.g. צ'רניחובסקי) are doubled.
+    Apply exactly once, where the filter string is built.
+    """
+    return value.replace("'", "''")
+
+
 def _sanitize_odata_search(name: str) -> str:
     """
     Prepare a bill name for use inside an OData contains() filter.
     - Strips parenthetical clauses (which break OData parser)
-    - Escapes remaining single quotes as ''
     - Collapses extra whitespace
+    Quotes are left as-is; _odata_quote escapes them when the filter is built.
     """
     # Remove anything inside parentheses (including nested)
     sanitized = re.sub(r'\(.*?\)', '', name)
@@ -217,8 +485,6 @@ def _sanitize_odata_search(name: str) -> str:
     sanitized = re.sub(r'\s+', ' ', sanitized).strip()
     # Remove trailing comma/dash left after stripping parens
     sanitized = sanitized.strip(',-– ').strip()
-    # Escape single quotes for OData
-    sanitized = sanitized.replace("'", "''")
     return sanitized
 
 
@@ -260,8 +526,7 @@ def _bill_search_terms(name: str) -> list[str]:
     if short and short != step3:
         terms.append(short)
 
-    # Escape single-quotes for OData in every term
-    return [t.replace("'", "''") for t in terms if t]
+    return [t for t in terms if t]
 
 
 def _bill_record_to_dict(bill: dict) -> dict:
@@ -296,38 +561,228 @@ def _search_bills_by_term(
 ) -> list[dict]:
     """Run a single OData contains() search and return up to `top` raw bill dicts."""
     base_url = f"{OFFICIAL_KNESSET_NEW_API}/KNS_Bill"
-    filter_expr = f"contains(Name,'{search_term}')"
+    filter_expr = f"contains(Name,'{_odata_quote(search_term)}')"
     if knesset_num:
         filter_expr += f" and KnessetNum eq {knesset_num}"
     params = {
         "$filter":  filter_expr,
-        "$expand":  "KNS_Status,KNS_BillInitiator($expand=KNS_Person)",
+        "$select":  _BILL_SELECT,
+        "$expand":  f"KNS_Status($select=Desc),KNS_BillInitiator($select=Id;$expand={_PERSON_SELECT})",
         "$top":     top,
         "$orderby": "LastUpdatedDate desc",
     }
     r = _retry_get(base_url, params=params, timeout=TIMEOUT)
     r.raise_for_status()
-    return r.json().get("value", [])
+    return _json(r).get("value", [])
 
 
-def _name_matches(mk: dict, query: str) -> bool:
-    """Check if a query string matches any known name or altname of an MK."""
-    query = query.strip()
-    full  = f"{mk.get('mk_individual_first_name', '')} {mk.get('mk_individual_name', '')}".strip()
-    candidates = [full, f"{mk.get('mk_individual_name', '')} {mk.get('mk_individual_first_name', '')}".strip()]
-    candidates += (mk.get("altnames") or [])
+def _norm_name(name: str) -> str:
+    """Canonical form for name comparison: _NAME_NOISE_RE stripped, lowercased."""
+    return _NAME_NOISE_RE.sub("", name).lower()
+
+
+def _name_words(name: str) -> list[str]:
+    """Normalized words of a name or query (split before _norm_name drops the spaces)."""
+    return [w for w in map(_norm_name, _NAME_WORD_SPLIT_RE.split(name)) if w]
+
+
+def _candidate_names(mk: dict) -> list[str]:
+    """A member's searchable names, raw: first-last, last-first, altnames."""
+    first = mk.get("mk_individual_first_name", "")
+    last  = mk.get("mk_individual_name", "")
+    names = (f"{first} {last}", f"{last} {first}", *(mk.get("altnames") or ()))
+    return [n for n in names if n and _norm_name(n)]
+
+
+@lru_cache(maxsize=1)
+def _lowered_name_index() -> list[tuple[dict, list[str]]]:
+    """
+    Pair each member (current, then former) with its normalized candidate names
+    (first-last, last-first, altnames), built once per fetch so a name search
+    only runs substring tests instead of re-normalizing every name.
+    """
+    return [(mk, [_norm_name(n) for n in _candidate_names(mk)]) for mk in _combined_members()]
+
+
+@lru_cache(maxsize=1)
+def _name_choices() -> tuple[list[str], list[dict]]:
+    """
+    Flatten the lowered name index into parallel lists: choices[i] is a name
+    of owners[i]. Indices follow member order, and the flat list feeds one
+    batched rapidfuzz call.
+    """
+    choices: list[str] = []
+    owners:  list[dict] = []
+    for mk, names in _lowered_name_index():
+        choices.extend(names)
+        owners.extend([mk] * len(names))
+    return choices, owners
+
+
+@lru_cache(maxsize=1)
+def _name_alphabet() -> frozenset[str]:
+    """Every character that occurs in a normalized candidate name."""
+    return frozenset("".join(_name_choices()[0]))
 
-    query_lower = query.lower()
-    for name in candidates:
-        if not name:
-            continue
-        # Exact match
-        if name.strip() == query:
-            return True
-        # Query is a substring of name or vice versa (handles partial names)
-        if query_lower in name.lower() or name.lower() in query_lower:
-            return True
-    return False
+
+def _rarest_letters(letters: set[str], freq: Counter, k: int = 2) -> list[str]:
+    """The k corpus-rarest of `letters` (ties broken alphabetically)."""
+    return sorted(letters, key=lambda ch: (freq[ch], ch))[:k]
+
+
+@lru_cache(maxsize=1)
+def _name_letter_index() -> tuple[Counter, dict[str, list[int]], dict[str, list[int]]]:
+    """
+    Rare-letter indexes over _name_choices(), after the parallel-passage
+    trick of representing a name by its two corpus-rarest letters:
+      freq      — letter → number of names containing it
+      by_letter — letter → indices of names containing it
+      by_fp     — fingerprint (a name's two rarest letters, sorted) → name indices
+    """
+    choices, _ = _name_choices()
+    letter_sets = [{ch for ch in n if ch.isalpha()} for n in choices]
+    freq: Counter = Counter(ch for letters in letter_sets for ch in letters)
+    by_letter: defaultdict[str, list[int]] = defaultdict(list)
+    by_fp:     defaultdict[str, list[int]] = defaultdict(list)
+    for i, letters in enumerate(letter_sets):
+        for ch in letters:
+            by_letter[ch].append(i)
+        by_fp["".join(sorted(_rarest_letters(letters, freq)))].append(i)
+    return freq, dict(by_letter), dict(by_fp)
+
+
+@lru_cache(maxsize=1)
+def _name_automaton():
+    """
+    Aho-Corasick automaton over _name_choices() (value: indices of that name),
+    so every name occurring inside a query is found in one pass over the query.
+    None when pyahocorasick isn't installed or there are no names.
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        return None
+    choices, _ = _name_choices()
+    by_name: defaultdict[str, list[int]] = defaultdict(list)
+    for i, n in enumerate(choices):
+        by_name[n].append(i)
+    if not by_name:
+        return None
+    automaton = ahocorasick.Automaton()
+    for n, indices in by_name.items():
+        automaton.add_word(n, indices)
+    automaton.make_automaton()
+    return automaton
+
+
+def _substring_candidates(q: str) -> list[int] | None:
+    """
+    Indices (ascending) of names that can satisfy `q in name or name in q`,
+    or None when q has no letters to narrow on.
+      q in name — the name contains q's two rarest letters: intersect postings.
+      name in q — exact hits from _name_automaton() when available; otherwise
+                  the name's fingerprint letters all occur in q: look up every
+                  one- and two-letter subset of q's letters.
+    Both are necessary conditions, so no substring match is lost.
+    """
+    letters = {ch for ch in q if ch.isalpha()}
+    if not letters:
+        return None
+    freq, by_letter, by_fp = _name_letter_index()
+
+    rare = _rarest_letters(letters, freq)
+    hits = set(by_letter.get(rare[0], ()))
+    for ch in rare[1:]:
+        hits.intersection_update(by_letter.get(ch, ()))
+
+    automaton = _name_automaton()
+    if automaton is not None:
+        for _end, indices in automaton.iter(q):
+            hits.update(indices)
+        return sorted(hits)
+
+    ordered = sorted(letters)
+    hits.update(by_fp.get("", ()))
+    for i, a in enumerate(ordered):
+        hits.update(by_fp.get(a, ()))
+        for b in ordered[i + 1:]:
+            hits.update(by_fp.get(a + b, ()))
+    return sorted(hits)
+
+
+def _padded_bigrams(word: str) -> set[str]:
+    """Character bigrams of ^word$ — one edit leaves at least one intact for len(word) >= 2."""
+    padded = f"^{word}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+@lru_cache(maxsize=1)
+def _name_word_index() -> tuple[dict[str, list[int]], dict[str, set[str]]]:
+    """
+    Word-level inverted index over _name_choices(), for narrowing the fuzzy pass:
+      by_word   — normalized word → indices of names containing it
+      by_bigram — padded bigram → words containing it (finds near-miss words)
+    Bigrams rather than trigrams: most Hebrew name words are 2-4 letters, and a
+    single typo can wipe out every trigram of a short word.
+    """
+    by_word: defaultdict[str, list[int]] = defaultdict(list)
+    i = 0
+    for mk in _combined_members():  # same order _name_choices() flattens
+        for name in _candidate_names(mk):
+            for w in set(_name_words(name)):
+                by_word[w].append(i)
+            i += 1
+    by_bigram: defaultdict[str, set[str]] = defaultdict(set)
+    for w in by_word:
+        for g in _padded_bigrams(w):
+            by_bigram[g].add(w)
+    return dict(by_word), dict(by_bigram)
+
+
+def _fuzzy_candidates(name: str) -> list[int] | None:
+    """
+    Indices (ascending) of names that, for every query word matching anything,
+    contain that word or one within a single edit of it. None when no name
+    survives — the caller then scores the full list, so a query made only of
+    heavier misspellings still gets the plain fuzzy scan.
+    """
+    by_word, by_bigram = _name_word_index()
+    survivors: set[int] | None = None
+    for w in set(_name_words(name)):
+        near = {
+            v for g in _padded_bigrams(w) for v in by_bigram.get(g, ())
+            if Levenshtein.distance(w, v, score_cutoff=1) <= 1
+        }
+        if not near:
+            continue  # noise word (title, typo beyond one edit) — don't let it veto
+        hits = {i for v in near for i in by_word[v]}
+        survivors = hits if survivors is None else survivors & hits
+    return sorted(survivors) if survivors else None
+
+
+def clear_caches() -> None:
+    """Drop all cached member data so the next call re-fetches from the API."""
+    global _members_fetched_at
+    _members_fetched_at = 0.0
+    _fetch_members.cache_clear()
+    _combined_members.cache_clear()
+    _mk_by_id.cache_clear()
+    _members_by_knesset.cache_clear()
+    _party_rosters.cache_clear()
+    _lowered_name_index.cache_clear()
+    _name_choices.cache_clear()
+    _name_alphabet.cache_clear()
+    _name_letter_index.cache_clear()
+    _name_automaton.cache_clear()
+    _name_word_index.cache_clear()
+
+
+def _expire_stale_members() -> None:
+    """
+    Drop the member caches once older than MEMBERS_CACHE_TTL, so long-running
+    services pick up roster changes without a restart. Called by the public
+    member lookups, ahead of any lru_cache layer.
+    """
+    if _members_fetched_at and time.monotonic() - _members_fetched_at > _config.MEMBERS_CACHE_TTL:
+        clear_caches()
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -337,10 +792,10 @@ def get_all_mks(knesset_num: int = 25) -> list[dict]:
     Return all MKs who served in a given Knesset, sorted by last name.
     Each entry contains: mk_id, full_name, party, is_current, email.
     """
-    members = _get_all_members_raw(knesset_num)
-    result  = [mk for mk in members]
-    result.sort(key=lambda x: x.get("last_name", ""))
-    return result
+    _expire_stale_members()
+    # Raw records carry the surname as mk_individual_name (may be null); sorted()
+    # copies, so the cached per-Knesset list itself is never reordered
+    return sorted(_get_all_members_raw(knesset_num), key=lambda x: x.get("mk_individual_name") or "")
 
 
 def get_all_parties(knesset_num: int = 25) -> list[dict]:
@@ -349,20 +804,9 @@ def get_all_parties(knesset_num: int = 25) -> list[dict]:
     sorted by MK count descending.
     Each entry contains: party, mk_count.
     """
-    members = _get_all_members_raw(knesset_num)
-    counts: dict[str, int] = {}
-    for mk in members:
-        faction = _most_recent_faction(
-            [f for f in (mk.get("factions") or []) if f],
-            knesset_num
-        )
-        if faction:
-            name = faction["faction_name"].strip()
-            counts[name] = counts.get(name, 0) + 1
-
-    result = [{"party": name, "mk_count": count} for name, count in counts.items()]
-    result.sort(key=lambda x: x["mk_count"], reverse=True)
-    return result
+    _expire_stale_members()
+    counts = Counter({name: len(members) for name, members in _party_rosters(knesset_num).items()})
+    return [{"party": name, "mk_count": n} for name, n in counts.most_common()]
 
 
 def get_party_members(party_query: str, knesset_num: int = 25, top_k: int = 3) -> list[dict]:
@@ -390,28 +834,57 @@ def get_party_members(party_query: str, knesset_num: int = 25, top_k: int = 3) -
     scored.sort(key=lambda x: x[1], reverse=True)
     top_matches = [(name, sc) for name, sc in scored[:top_k] if sc > 0.1]
 
-    members_raw = _get_all_members_raw(knesset_num)
-    results: list[dict] = []
-    for party_name, _sc in top_matches:
-        mk_count = next((p["mk_count"] for p in parties if p["party"] == party_name), 0)
-        members: list[dict] = []
-        for mk in members_raw:
-            faction = _most_recent_faction(
-                [f for f in (mk.get("factions") or []) if f],
-                knesset_num,
-            )
-            if faction and faction["faction_name"].strip() == party_name:
-                members.append({
-                    "mk_id":      str(mk.get("mk_individual_id") or ""),
-                    "full_name":  f"{mk.get('mk_individual_first_name', '')} {mk.get('mk_individual_name', '')}".strip() or mk.get("mk_individual_name") or "",
-                    "is_current": bool(mk.get("IsCurrent", False)),
-                })
-        results.append({
+    rosters = _party_rosters(knesset_num)
+    return [
+        {
             "party":    party_name,
-            "mk_count": mk_count,
-            "members":  sorted(members, key=lambda m: m.get("full_name", "")),
-        })
-    return results
+            "mk_count": len(rosters[party_name]),
+            "members":  [m.to_dict() for m in rosters[party_name]],
+        }
+        for party_name, _sc in top_matches
+    ]
+
+
+def _iter_mk_matches(name: str, knesset_num: int = 25) -> Iterator[dict]:
+    """
+    Yield MKs matching a name (Hebrew, partial, or altname), lazily and each
+    at most once: substring matches in member order, or — only when there are
+    none — fuzzy matches best score first.
+    """
+    _expire_stale_members()
+    q = _norm_name(name)
+    # Nothing to match on (empty, or only digits/symbols/other scripts): no
+    # name can be a substring of q, nor q of a name, nor score as a fuzzy hit
+    if _name_alphabet().isdisjoint(q):
+        return
+    choices, owners = _name_choices()
+    candidates = _substring_candidates(q)
+    if candidates is None:
+        candidates = range(len(choices))
+
+    # Query is a substring of a name or vice versa (handles partial names)
+    seen_ids: set[int] = set()
+    for i in candidates:
+        n = choices[i]
+        if (q in n or n in q) and id(owners[i]) not in seen_ids:
+            seen_ids.add(id(owners[i]))
+            yield owners[i]
+    if seen_ids:
+        return
+
+    # No substring hit — fall back to fuzzy matching (typos, spelling variants),
+    # best score first, scoring only names that share a (near-)word with the query
+    pool = _fuzzy_candidates(name)
+    for _choice, _score, j in process.extract(
+        q, choices if pool is None else [choices[i] for i in pool],
+        scorer=fuzz.partial_ratio,
+        score_cutoff=_config.MK_NAME_FUZZY_THRESHOLD,
+        limit=20,
+    ):
+        mk = owners[j if pool is None else pool[j]]
+        if id(mk) not in seen_ids:
+            seen_ids.add(id(mk))
+            yield mk
 
 
 def _search_mks_by_name(name: str, knesset_num: int = 25) -> list[dict]:
@@ -419,14 +892,7 @@ def _search_mks_by_name(name: str, knesset_num: int = 25) -> list[dict]:
     Search for MKs by name (Hebrew, partial, or altname).
     Returns a list of MK dicts.
     """
-    current = _fetch_members(True)
-    former  = _fetch_members(False)
-    matches = [
-        mk
-        for mk in (current + former)
-        if _name_matches(mk, name)
-    ]
-    return matches
+    return list(_iter_mk_matches(name, knesset_num))
 
 
 def get_all_committees(knesset_num: int = 25) -> list[dict]:
@@ -444,7 +910,7 @@ def get_all_committees(knesset_num: int = 25) -> list[dict]:
             "KnessetNum":  c.get("KnessetNum"),
             "IsCurrent":   c.get("IsCurrent"),
         }
-        for c in response.json()
+        for c in _json(response)
         if c.get("Name")
     ]
     committees.sort(key=lambda c: c["Name"])
@@ -454,23 +920,57 @@ def get_all_committees(knesset_num: int = 25) -> list[dict]:
 def _search_committees_by_name(name: str, knesset_num: int = 25) -> list[dict]:
     """
     Search for Knesset committees by name (Hebrew, partial match) and Knesset number.
-    Uses the /committees_kns_committee/list endpoint.
-    Returns a list of dicts: {CommitteeID, Name, KnessetNum, IsCurrent}.
+    The substring match runs server-side (OData KNS_Committee, contains + $select),
+    so only matching rows are transferred.
+    Returns a list of dicts: {CommitteeID, Name, KnessetNum, IsCurrent}, best
+    match first — an exact name, then shorter (less qualified) names.
     """
-    url = f"{OKNESSET_API}/committees_kns_committee/list"
-    params = {"Name": name, "KnessetNum": knesset_num, "limit": 100}
-    response = _retry_get(url, params=params, timeout=TIMEOUT)
+    name = name.strip()
+    params = {
+        "$filter": f"contains(Name,'{_odata_quote(name)}') and KnessetNum eq {knesset_num}",
+        "$select": "Id,Name,KnessetNum,IsCurrent",
+        "$top":    20,
+    }
+    response = _retry_get(f"{OFFICIAL_KNESSET_NEW_API}/KNS_Committee", params=params, timeout=TIMEOUT)
     response.raise_for_status()
-    results = response.json()
-    return [
+    committees = [
         {
-            "CommitteeID": c["CommitteeID"],
-            "Name":        c.get("Name", ""),
+            "CommitteeID": c["Id"],
+            "Name":        c.get("Name") or "",
             "KnessetNum":  c.get("KnessetNum"),
             "IsCurrent":   c.get("IsCurrent"),
         }
-        for c in results
+        for c in _json(response).get("value", [])
     ]
+    committees.sort(key=lambda c: (c["Name"].strip() != name, len(c["Name"])))
+    return committees
+
+
+def _committee_members_from_rows(rows: list[dict]) -> list[dict]:
+    """
+    Collapse KNS_PersonToPosition rows (expanded with KNS_Person/KNS_Position)
+    into one entry per MK, sorted by name. Acting roles (מ"מ) are dropped and
+    a chair role wins over a plain membership.
+    """
+    seen: dict[int, dict] = {}
+    for row in rows:
+        position = row.get("KNS_Position") or {}
+        # DutyDesc is the gendered, committee-specific role string; fall back to Position.Description
+        duty = row.get("DutyDesc") or position.get("Description") or ""
+        if _DUTY_ACTING in duty:
+            continue
+
+        mk_id = row.get("PersonID")
+        entry = seen.get(mk_id)
+        if entry is None:
+            person = row.get("KNS_Person") or {}
+            full_name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
+            seen[mk_id] = {"mk_id": mk_id, "full_name": full_name, "duty_desc": duty}
+        elif _DUTY_CHAIR in duty and _DUTY_CHAIR not in entry["duty_desc"]:
+            # Prefer chair role over plain member if we see both
+            entry["duty_desc"] = duty
+
+    return sorted(seen.values(), key=lambda x: x["full_name"])
 
 
 def _get_active_committee_members_by_id(
@@ -488,33 +988,63 @@ def _get_active_committee_members_by_id(
         filter_expr += " and IsCurrent eq true"
 
     params = {
-        "$expand": "KNS_Person,KNS_Position",
+        "$select": "PersonID,DutyDesc",
+        "$expand": _COMMITTEE_MEMBER_EXPAND,
         "$filter": filter_expr,
         "$top":    500,
     }
     r = _retry_get(url, params=params, timeout=TIMEOUT)
     r.raise_for_status()
+    return _committee_members_from_rows(_json(r).get("value", []))
 
-    seen: dict[int, dict] = {}
-    for row in r.json().get("value", []):
-        person   = row.get("KNS_Person") or {}
-        position = row.get("KNS_Position") or {}
-        mk_id    = row.get("PersonID")
-        full_name = f"{person.get('FirstName', '')} {person.get('LastName', '')}".strip()
-        # DutyDesc is the gendered, committee-specific role string; fall back to Position.Description
-        duty = row.get("DutyDesc") or position.get("Description") or ""
-        
-        if 'מ"מ' in duty:
-            continue
 
-        if mk_id not in seen:
-            seen[mk_id] = {"mk_id": mk_id, "full_name": full_name, "duty_desc": duty}
-        else:
-            # Prefer chair role over plain member if we see both
-            if 'יו"ר' in duty and 'יו"ר' not in seen[mk_id]["duty_desc"]:
-                seen[mk_id]["duty_desc"] = duty
+def _get_active_committee_members_by_name(name: str, knesset_num: int = 25) -> list[dict] | None:
+    """
+    Single-request form of get_committee_members for an exact committee name:
+    KNS_PersonToPosition filtered through its KNS_Committee navigation property,
+    saving the separate committee lookup.
+    An optional shortcut, so it is one attempt with no retries: returns None
+    when nothing matches exactly or the request fails in any way (4xx/5xx —
+    the server answers a filter it can't handle with a 500 — connection
+    errors, timeouts, bad JSON); the caller then resolves the name first.
+    """
+    params = {
+        "$select": "PersonID,DutyDesc,CommitteeID",
+        "$expand": _COMMITTEE_MEMBER_EXPAND,
+        "$filter": (
+            f"KNS_Committee/Name eq '{_odata_quote(name.strip())}'"
+            f" and KnessetNum eq {knesset_num} and IsCurrent eq true"
+        ),
+        "$top":    500,
+    }
+    try:
+        r = _SESSION.get(f"{OFFICIAL_KNESSET_NEW_API}/KNS_PersonToPosition", params=params, timeout=TIMEOUT)
+        r.raise_for_status()
+        rows = _json(r).get("value", [])
+    except (requests.exceptions.RequestException, ValueError) as exc:
+        print(f"[knesset_db] committee-by-name shortcut failed ({exc}); resolving the name first", flush=True)
+        return None
+    if not rows:
+        return None
+    # Same-named committees are not expected within one Knesset; keep the first
+    committee_id = rows[0].get("CommitteeID")
+    return _committee_members_from_rows([row for row in rows if row.get("CommitteeID") == committee_id])
 
-    return sorted(seen.values(), key=lambda x: x["full_name"])
+
+def get_members_for_committees(
+    committee_ids: list[int],
+    knesset_num: int = 25,
+) -> dict[int, list[dict]]:
+    """
+    Active members of several committees at once, keyed by committee id.
+    The per-committee requests are independent, so they run concurrently on
+    _POOL and the total wait is the slowest one rather than the sum.
+    """
+    ids = list(dict.fromkeys(committee_ids))
+    members = _POOL.map(
+        lambda cid: _get_active_committee_members_by_id(cid, knesset_num), ids,
+    )
+    return dict(zip(ids, members))
 
 
 def get_mk_profile(name: str, knesset_num: int = 25) -> dict | None:
@@ -522,16 +1052,24 @@ def get_mk_profile(name: str, knesset_num: int = 25) -> dict | None:
     Look up an MK by name and return their full profile.
     Returns None if not found. If multiple match, returns the first with a flag.
     """
-    matches = _search_mks_by_name(name, knesset_num)
-    if not matches:
+    matches = _iter_mk_matches(name, knesset_num)
+    first = next(matches, None)
+    if first is None:
         return None
-    result = matches[0]
-    result["multiple_matches"] = len(matches) > 1
-    if len(matches) > 1:
-        result["other_matches"] = [m["full_name"] for m in matches[1:] if "full_name" in m]
+    second = next(matches, None)
+    result = dict(first)  # the match is the cached member record — don't annotate it
+    result["multiple_matches"] = second is not None
+    if second is not None:
+        result["other_matches"] = [_mk_full_name(m) for m in (second, *matches)]
     return result
 
 
+def get_mk_by_id(mk_id: str | int) -> dict | None:
+    """Return the member whose mk_individual_id or PersonID equals mk_id, or None."""
+    _expire_stale_members()
+    return _mk_by_id().get(str(mk_id))
+
+
 def _resolve_bill_by_name(
     name_part: str,
     knesset_num: int | None = None,
@@ -565,21 +1103,19 @@ def _get_bill_documents(bill_id: int) -> list[dict]:
     """
     r = _retry_get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_DocumentBill",
-        params={"$filter": f"BillID eq {bill_id}", "$top": 20},
+        params={
+            "$filter": f"BillID eq {bill_id}",
+            "$select": f"{_DOCUMENT_SELECT},GroupTypeDesc",
+            "$top":    20,
+        },
         timeout=TIMEOUT,
     )
     r.raise_for_status()
 
-    docs = r.json().get("value", [])
-
-    def _priority(doc):
-        desc = doc.get("GroupTypeDesc", "")
-        try:
-            return _DOC_GROUP_PRIORITY.index(desc)
-        except ValueError:
-            return len(_DOC_GROUP_PRIORITY)
+    docs = _json(r).get("value", [])
 
-    docs.sort(key=_priority)
+    unranked = len(_DOC_GROUP_RANK)
+    docs.sort(key=lambda doc: _DOC_GROUP_RANK.get(doc.get("GroupTypeDesc", ""), unranked))
     return [
         {
             "doc_id":    doc["Id"],
@@ -593,6 +1129,32 @@ def _get_bill_documents(bill_id: int) -> list[dict]:
     ]
 
 
+def _extract_bill_text(url: str, max_chars: int) -> str:
+    """
+    Download a bill PDF and extract its text (see _extract_pdf_text for max_chars).
+    Only the text is kept, on disk under BILL_DOCS_CACHE_DIR: one file per
+    URL, extracted up to BILL_TEXT_MAX_MAX_CHARS (the tool's largest limit)
+    and sliced by the caller, so every max_chars shares it. Files older than
+    BILL_DOCS_CACHE_TTL are re-fetched, picking up documents replaced at the
+    same URL. Download errors propagate uncached.
+    """
+    cap = _config.BILL_TEXT_MAX_MAX_CHARS
+    if max_chars > cap:  # beyond what the cache holds — extract fresh
+        return _extract_pdf_text(_download_document(url, _config.BILL_DOC_MAX_BYTES), max_chars)
+
+    text_path = _config.BILL_DOCS_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.txt"
+    try:
+        if time.time() - text_path.stat().st_mtime < _config.BILL_DOCS_CACHE_TTL:
+            return text_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    text = _extract_pdf_text(_download_document(url, _config.BILL_DOC_MAX_BYTES), cap)
+    if text:
+        _write_cache_file(text_path, text.encode("utf-8"))
+    return text
+
+
 def _get_bill_text_by_id(bill_id: int, max_chars: int = 8000) -> dict | None:
     """
     Fetch the most relevant document for a bill and extract its text.
@@ -608,10 +1170,7 @@ def _get_bill_text_by_id(bill_id: int, max_chars: int = 8000) -> dict | None:
         if doc["format"] not in ("PDF",):
             continue
         try:
-            response = _retry_get(doc["url"], timeout=TIMEOUT)
-            response.raise_for_status()
-
-            full_text = _extract_pdf_text(response.content)
+            full_text = _extract_bill_text(doc["url"], max_chars)
             if not full_text:
                 continue  # try next doc
 
@@ -631,34 +1190,45 @@ def _get_bill_text_by_id(bill_id: int, max_chars: int = 8000) -> dict | None:
     return None
 
 
-def _get_bill_details_by_id(bill_id: int) -> dict | None:
-    # Request 1: bill + status only (no nested expand)
-    url = (
-        f"{OFFICIAL_KNESSET_NEW_API}/KNS_Bill({bill_id})"
-        f"?$expand=KNS_Status"
-    )
-    r = _retry_get(url, timeout=TIMEOUT)
-    if r.status_code == 404:
-        return None
-    r.raise_for_status()
-    bill = r.json()
-
-    # Request 2: initiators separately
-    r2 = _retry_get(
+def _get_bill_initiators(bill_id: int) -> list[dict]:
+    """Return [{person_id, full_name}] for a bill's initiators (KNS_BillInitiator)."""
+    r = _retry_get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_BillInitiator",
-        params={"$filter": f"BillID eq {bill_id}", "$expand": "KNS_Person", "$top": 20},
+        params={
+            "$filter": f"BillID eq {bill_id}",
+            "$select": "Id",
+            "$expand": _PERSON_SELECT,
+            "$top":    20,
+        },
         timeout=TIMEOUT,
     )
-    r2.raise_for_status()
-    initiators = [
+    r.raise_for_status()
+    return [
         {
             "person_id": bi["KNS_Person"]["Id"],
             "full_name": f"{bi['KNS_Person'].get('FirstName', '')} {bi['KNS_Person'].get('LastName', '')}".strip(),
         }
-        for bi in r2.json().get("value", [])
+        for bi in _json(r).get("value", [])
         if bi.get("KNS_Person")
     ]
 
+
+def _get_bill_details_by_id(bill_id: int) -> dict | None:
+    r = _retry_get(
+        f"{OFFICIAL_KNESSET_NEW_API}/KNS_Bill({bill_id})",
+        params={"$select": _BILL_SELECT, "$expand": "KNS_Status($select=Desc)"},
+        timeout=TIMEOUT,
+    )
+    if r.status_code == 404:
+        return None
+    r.raise_for_status()
+    bill = _json(r)
+    # Only once the bill exists (model-guessed ids are often 404s): initiators
+    # and documents are independent, so fetch them concurrently — documents on
+    # _POOL, initiators on this thread.
+    documents_f = _POOL.submit(_get_bill_documents, bill_id)
+    initiators  = _get_bill_initiators(bill_id)
+
     return {
         "bill_id":          bill.get("Id"),
         "bill_name":        bill.get("Name"),
@@ -671,7 +1241,7 @@ def _get_bill_details_by_id(bill_id: int) -> dict | None:
         "publication_date": bill.get("PublicationDate"),
         "last_updated":     bill.get("LastUpdatedDate"),
         "initiators":       initiators,
-        "documents":        _get_bill_documents(bill_id),
+        "documents":        documents_f.result(),
     }
 
 
@@ -700,8 +1270,17 @@ def get_bill_text(bill_name: str, knesset_num: int = 25, max_chars: int = 8000)
 def get_committee_members(name: str, knesset_num: int = 25) -> list[dict]:
     """
     Look up a committee by name and return its active members.
-    Single public name-first form.
-    """
+    Single public name-first form. A name that looks like a full committee
+    name (starts with one of _COMMITTEE_NAME_PREFIXES) is first tried as an
+    exact match in one request; partial names ("כספים") go straight to
+    resolving the committee, then its members. The tradeoff: a full-looking
+    name that isn't exact ("ועדת כספים") pays one wasted request before the
+    two-call path.
+    """
+    if name.strip().startswith(_COMMITTEE_NAME_PREFIXES):
+        members = _get_active_committee_members_by_name(name, knesset_num)
+        if members is not None:
+            return members
     committees = _search_committees_by_name(name, knesset_num)
     if not committees:
         return []
@@ -711,18 +1290,49 @@ def get_committee_members(name: str, knesset_num: int = 25) -> list[dict]:
 
 # ── Committee sessions ────────────────────────────────────────────────────────
 
-def get_committee_sessions(committee_id: int, knesset_num: int = 25) -> list[dict]:
+def _odata_date_bound(value: str, *, upper: bool = False) -> str:
+    """
+    Turn a YYYY[-MM[-DD]] date prefix into an OData datetime literal.
+    Lower bounds are the first day of the period; upper bounds are exclusive,
+    i.e. the first day after it. Raises ValueError on malformed input.
+    """
+    parts = [int(p) for p in value.strip()[:10].split("-")]
+    year, month, day = (parts + [1, 1])[:3]
+    bound = date(year, month, day)
+    if upper:
+        if len(parts) == 1:
+            bound = date(year + 1, 1, 1)
+        elif len(parts) == 2:
+            bound = date(year + month // 12, month % 12 + 1, 1)
+        else:
+            bound += timedelta(days=1)
+    return f"{bound.isoformat()}T00:00:00Z"
+
+
+def get_committee_sessions(
+    committee_id: int,
+    knesset_num: int = 25,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[dict]:
     """
     List ALL sessions for a committee from OData KNS_CommitteeSession, newest first.
     Uses $count=true on first request to determine total, then paginates exactly
     as many times as needed (avoids blind range-based pagination up to 100K).
+    Optional date_from / date_to (inclusive, YYYY[-MM[-DD]]) are pushed into the
+    server-side $filter, so only sessions in range are counted and paged.
     Returns list of {session_id, date, committee_id, knesset_num, type_id, status_id, note}.
     Check type_id against SESSION_TYPE_CLASSIFIED to skip classified sessions.
     """
     url       = f"{OFFICIAL_KNESSET_NEW_API}/KNS_CommitteeSession"
     page_size = 100
+    filter_expr = f"CommitteeID eq {committee_id} and KnessetNum eq {knesset_num}"
+    if date_from:
+        filter_expr += f" and StartDate ge {_odata_date_bound(date_from)}"
+    if date_to:
+        filter_expr += f" and StartDate lt {_odata_date_bound(date_to, upper=True)}"
     base_params = {
-        "$filter":  f"CommitteeID eq {committee_id} and KnessetNum eq {knesset_num}",
+        "$filter":  filter_expr,
         "$select":  "Id,CommitteeID,KnessetNum,StartDate,Note,TypeID,StatusID",
         "$orderby": "StartDate desc",
         "$top":     page_size,
@@ -731,7 +1341,7 @@ def get_committee_sessions(committee_id: int, knesset_num: int = 25) -> list[dic
     # First request: get count + first page in one shot
     r = _retry_get(url, params={**base_params, "$count": "true"}, timeout=TIMEOUT)
     r.raise_for_status()
-    data  = r.json()
+    data  = _json(r)
     total = data.get("@odata.count", 0)
     all_sessions: list[dict] = list(data.get("value", []))
 
@@ -739,7 +1349,7 @@ def get_committee_sessions(committee_id: int, knesset_num: int = 25) -> list[dic
     for offset in range(page_size, total, page_size):
         r = _retry_get(url, params={**base_params, "$skip": offset}, timeout=TIMEOUT)
         r.raise_for_status()
-        all_sessions.extend(r.json().get("value", []))
+        all_sessions.extend(_json(r).get("value", []))
 
     return [
         {
@@ -815,7 +1425,11 @@ def _get_session_documents(session_id: int) -> list[dict]:
     """Return document metadata for a session from KNS_DocumentCommitteeSession."""
     r = _retry_get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_DocumentCommitteeSession",
-        params={"$filter": f"CommitteeSessionID eq {session_id}", "$top": 20},
+        params={
+            "$filter": f"CommitteeSessionID eq {session_id}",
+            "$select": f"{_DOCUMENT_SELECT},DocumentName",
+            "$top":    20,
+        },
         timeout=TIMEOUT,
     )
     r.raise_for_status()
@@ -827,7 +1441,7 @@ def _get_session_documents(session_id: int) -> list[dict]:
             "format":     doc.get("ApplicationDesc"),
             "url":        _fix_file_path(doc["FilePath"]),
         }
-        for doc in r.json().get("value", [])
+        for doc in _json(r).get("value", [])
         if doc.get("FilePath")
     ]
 
@@ -852,21 +1466,21 @@ def _get_session_protocol_text(session_id: int, max_chars: int | None = None) ->
         if fmt not in ("pdf", "word", "doc", "docx"):
             continue
         try:
-            response = _retry_get(doc["url"], timeout=TIMEOUT)
-            response.raise_for_status()
+            content = _download_document(doc["url"], _config.PROTOCOL_DOC_MAX_BYTES)
             if fmt == "pdf":
-                text = _extract_pdf_text(response.content)
+                text = _extract_pdf_text(content, max_chars or None)
             elif doc["url"].lower().endswith(".doc"):
-                text = _extract_doc_text(response.content)
+                text = _extract_doc_text(content)
             else:
-                text = _extract_docx_text(response.content)
+                text = _extract_docx_text(content)
             if not text:
                 continue
             if max_chars:
                 text = text[:max_chars]
             return {"session_id": session_id, "doc_id": doc["doc_id"],
                     "name": doc["name"], "url": doc["url"], "text": text}
-        except Exception:
+        except Exception as exc:
+            print(f"[knesset_db] _get_session_protocol_text: doc {doc.get('url')!r} failed ({exc}); trying next", flush=True)
             continue
     return None
 
@@ -934,13 +1548,13 @@ def _fetch_votes_metadata(vote_ids: list[int]) -> dict[int, dict]:
     if not vote_ids:
         return {}
     filter_expr = " or ".join(f"Id eq {vid}" for vid in vote_ids)
-    r = requests.get(
+    r = _SESSION.get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVote",
-        params={"$filter": filter_expr},
+        params={"$filter": filter_expr, "$select": _VOTE_SELECT},
         timeout=TIMEOUT,
     )
     r.raise_for_status()
-    return {v["Id"]: v for v in r.json().get("value", [])}
+    return {v["Id"]: v for v in _json(r).get("value", [])}
 
 
 def _format_vote_with_result(vote_meta: dict, result_desc: str) -> dict:
@@ -961,8 +1575,8 @@ def _mk_name_filter(mk: dict) -> str:
     Uses LastName from voting results (= mk_individual_name from oknesset).
     Adds FirstName clause when available for disambiguation.
     """
-    last  = (mk.get("mk_individual_name") or "").strip().replace("'", "''")
-    first = (mk.get("mk_individual_first_name") or "").strip().replace("'", "''")
+    last  = _odata_quote((mk.get("mk_individual_name") or "").strip())
+    first = _odata_quote((mk.get("mk_individual_first_name") or "").strip())
     if first:
         return f"LastName eq '{last}' and FirstName eq '{first}'"
     return f"LastName eq '{last}'"
@@ -978,17 +1592,18 @@ def get_mk_votes(mk_name: str, knesset_num: int = 25, top_n: int = 20) -> list[d
     if not mk:
         return []
 
-    r = requests.get(
+    r = _SESSION.get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVoteResult",
         params={
             "$filter":  _mk_name_filter(mk),
+            "$select":  "VoteID,ResultDesc",
             "$top":     top_n,
             "$orderby": "Id desc",
         },
         timeout=TIMEOUT,
     )
     r.raise_for_status()
-    results = r.json().get("value", [])
+    results = _json(r).get("value", [])
 
     vote_ids = list({row["VoteID"] for row in results if row.get("VoteID")})
     votes_by_id = _fetch_votes_metadata(vote_ids)
@@ -1006,11 +1621,11 @@ def get_votes_on_topic(topic: str, top_n: int = 20) -> list[dict]:
     Returns up to `top_n` most recent matches.
     Each entry: vote_id, vote_title, vote_subject, vote_datetime, vote_method, is_no_confidence.
     """
-    safe = topic.replace("'", "''")
+    safe = _odata_quote(topic)
     filter_expr = f"contains(VoteTitle,'{safe}') or contains(VoteSubject,'{safe}')"
-    r = requests.get(
+    r = _SESSION.get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVote",
-        params={"$filter": filter_expr, "$top": top_n, "$orderby": "Id desc"},
+        params={"$filter": filter_expr, "$select": _VOTE_SELECT, "$top": top_n, "$orderby": "Id desc"},
         timeout=TIMEOUT,
     )
     r.raise_for_status()
@@ -1023,7 +1638,7 @@ def get_votes_on_topic(topic: str, top_n: int = 20) -> list[dict]:
             "vote_method":      v.get("VoteMethodDesc"),
             "is_no_confidence": v.get("IsNoConfidenceInGov"),
         }
-        for v in r.json().get("value", [])
+        for v in _json(r).get("value", [])
     ]
 
 
@@ -1038,30 +1653,34 @@ def get_votes_on_topic_by_mk(
     Combines get_votes_on_topic + per-MK result lookup.
     Each entry: vote_id, vote_title, vote_subject, vote_datetime, vote_method, result.
     """
-    votes = get_votes_on_topic(topic, top_n=top_n)
-    if not votes:
-        return []
-
+    # The topic search and the MK lookup are independent — overlap them.
+    # (The MK lookup stays on this thread: it may itself submit to _POOL.)
+    votes_f = _POOL.submit(get_votes_on_topic, topic, top_n=top_n)
     mk = get_mk_profile(mk_name, knesset_num)
-    if not mk:
+    votes = votes_f.result()
+    if not votes or not mk:
         return []
 
     vote_ids = [v["vote_id"] for v in votes]
-    votes_by_id = {v["vote_id"]: v for v in votes}
 
     # OData MaxNodeCount=100: batch VoteIDs to stay well under the limit.
     # Each VoteID clause ≈ 4 AST nodes; name filter ≈ 9; use batch of 10.
     name_filter = _mk_name_filter(mk)
-    result_by_vote: dict[int, str] = {}
-    for i in range(0, len(vote_ids), 10):
-        id_filter = " or ".join(f"VoteID eq {vid}" for vid in vote_ids[i:i + 10])
-        r = requests.get(
+
+    def _fetch_batch(batch: list[int]) -> list[dict]:
+        id_filter = " or ".join(f"VoteID eq {vid}" for vid in batch)
+        r = _SESSION.get(
             f"{OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVoteResult",
-            params={"$filter": f"{name_filter} and ({id_filter})"},
+            params={"$filter": f"{name_filter} and ({id_filter})", "$select": "VoteID,ResultDesc"},
             timeout=TIMEOUT,
         )
         r.raise_for_status()
-        for row in r.json().get("value", []):
+        return _json(r).get("value", [])
+
+    batches = [vote_ids[i:i + 10] for i in range(0, len(vote_ids), 10)]
+    result_by_vote: dict[int, str] = {}
+    for rows in _POOL.map(_fetch_batch, batches):
+        for row in rows:
             if row.get("VoteID"):
                 result_by_vote[row["VoteID"]] = row.get("ResultDesc", "")
 
@@ -1076,9 +1695,9 @@ def get_recent_votes(top_n: int = 10) -> list[dict]:
     Return the `top_n` most recent plenum votes (no MK filter).
     Each entry: vote_id, vote_title, vote_subject, vote_datetime, vote_method, is_no_confidence.
     """
-    r = requests.get(
+    r = _SESSION.get(
         f"{OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVote",
-        params={"$orderby": "Id desc", "$top": top_n},
+        params={"$select": _VOTE_SELECT, "$orderby": "Id desc", "$top": top_n},
         timeout=TIMEOUT,
     )
     r.raise_for_status()
@@ -1091,5 +1710,5 @@ def get_recent_votes(top_n: int = 10) -> list[dict]:
             "vote_method":      v.get("VoteMethodDesc"),
             "is_no_confidence": v.get("IsNoConfidenceInGov"),
         }
-        for v in r.json().get("value", [])
+        for v in _json(r).get("value", [])
     ]
\ No newline at end of file
@@ -9,4 +9,6 @@ Submodules:
     helper used by every ``find_*`` tool (per §5.4).
   * :mod:`utils.tool_helpers.adapters` — thin envelope-wrappers around
     existing :mod:`utils.knesset_db` calls.
+  * :mod:`utils.tool_helpers.serialize` — JSON encoding/decoding (orjson
+    when installed), shared with :mod:`utils.knesset_db`.
 """
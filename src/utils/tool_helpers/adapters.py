@@ -23,8 +23,10 @@ import json
 import traceback
 
 from agent.subgraph.evidence import ToolEnvelope
+from utils.tool_helpers.serialize import dumps as dumps_payload
 from utils.knesset_db import (
     _get_active_committee_members_by_id,
+    _odata_date_bound,
     get_all_committees,
     get_bill_details,
     get_bill_text,
@@ -74,7 +76,7 @@ def _ok(
 
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False, default=str),
+        full=dumps_payload(payload),
         metadata=metadata,
         provenance=provenance or {},
     )
@@ -223,7 +225,7 @@ def adapt_get_committee_sessions(
     date_from: str | None = None,
     date_to: str | None = None,
 ) -> ToolEnvelope:
-    """Wrap :func:`get_committee_sessions` with optional date-range filter."""
+    """Wrap :func:`get_committee_sessions`; the date range is filtered server-side."""
     def _run() -> ToolEnvelope:
         try:
             cid = int(committee_id)
@@ -235,17 +237,27 @@ def adapt_get_committee_sessions(
                 committee_id=str(committee_id),
             )
 
-        sessions = get_committee_sessions(cid, knesset_num=knesset_num)
-
-        if date_from or date_to:
-            def _in_range(s: dict) -> bool:
-                d = (s.get("date") or "")[:10]
-                if date_from and d < date_from:
-                    return False
-                if date_to and d > date_to:
-                    return False
-                return True
-            sessions = [s for s in sessions if _in_range(s)]
+        try:
+            if date_from:
+                _odata_date_bound(date_from)
+            if date_to:
+                _odata_date_bound(date_to, upper=True)
+        except (AttributeError, TypeError, ValueError):  # AttributeError: non-string, e.g. 2024
+            return _err(
+                "invalid_date_range",
+                kind="fetch",
+                source="odata",
+                committee_id=str(committee_id),
+                date_from=date_from,
+                date_to=date_to,
+            )
+
+        sessions = get_committee_sessions(
+            cid,
+            knesset_num=knesset_num,
+            date_from=date_from,
+            date_to=date_to,
+        )
 
         return _ok(
             sessions,
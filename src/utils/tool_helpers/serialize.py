@@ -0,0 +1,50 @@
+"""JSON encoding/decoding, with ``orjson`` when installed.
+
+The one place the optional ``orjson`` import lives: tool payloads are dumped
+to ``ToolEnvelope.full`` strings here (once per tool call, on payloads that
+can hold whole member lists or bill texts), and :mod:`utils.knesset_db`
+decodes API responses and reads/writes its disk caches through the same
+functions, so the two fallbacks cannot drift apart.
+
+``orjson`` keeps Hebrew as UTF-8 (like ``ensure_ascii=False``) and is several
+times faster than the stdlib codec; without it this is exactly
+``json.dumps(obj, ensure_ascii=False, default=str)`` / ``json.loads``.
+
+Output is compact (no spaces after separators) on the orjson path. Callers
+must treat the string as JSON, never compare it textually.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialise ``obj`` to UTF-8 JSON bytes; unknown types fall back to ``str()``."""
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # e.g. ints beyond 64 bits — the stdlib encoder handles them
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def dumps(obj) -> str:
+    """Serialise ``obj`` to a JSON string; unknown types fall back to ``str()``."""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document; raises ``ValueError`` on malformed input."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
@@ -27,6 +27,7 @@ from __future__ import annotations
 import json
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
@@ -38,8 +39,11 @@ from retrieval.lemmatize import lemmatize
 from utils.knesset_db import (
     _get_bill_details_by_id,
     _get_bill_text_by_id,
+    _json,
     _resolve_bill_by_name,
+    _retry_get,
     get_bill_details,
+    get_mk_by_id,
     get_party_members,
     get_session_transcript,
 )
@@ -54,6 +58,7 @@ from utils.tool_helpers.adapters import (
 )
 from utils.tool_helpers.fuzzy_name_index import FuzzyNameIndex
 from utils.tool_helpers.name_search import name_search
+from utils.tool_helpers.serialize import dumps as dumps_payload
 
 
 # ---------------------------------------------------------------------------
@@ -150,8 +155,7 @@ def dispatch(registry: ToolRegistry, name: str, args: dict) -> ToolEnvelope:
         print(f"[tools] ← {name}  (non-envelope result)", flush=True)
         return ToolEnvelope(
             summary="",
-            full=json.dumps(result, ensure_ascii=False, default=str)
-                 if result is not None else "",
+            full=dumps_payload(result) if result is not None else "",
             metadata={"kind": "fetch", "source": "dispatch", "count": 0},
             provenance={"tool_name": name},
             error="handler_returned_non_envelope",
@@ -165,6 +169,25 @@ def dispatch(registry: ToolRegistry, name: str, args: dict) -> ToolEnvelope:
     return result
 
 
+def dispatch_many(
+    registry: ToolRegistry,
+    calls: list[tuple[str, dict]],
+) -> list[ToolEnvelope]:
+    """Run several independent tool calls concurrently; envelopes in call order.
+
+    For a model turn that emits more than one tool call: each call is
+    typically blocked on Knesset API round trips, so wall-clock drops to
+    the slowest call instead of the sum. Never raises (see :func:`dispatch`).
+    Uses its own short-lived threads — handlers fan out on
+    ``knesset_db._POOL`` themselves, so they must not run inside it.
+    """
+    if len(calls) <= 1:
+        return [dispatch(registry, name, args) for name, args in calls]
+    workers = min(len(calls), config.API_MAX_PARALLEL_REQUESTS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dispatch") as pool:
+        return list(pool.map(lambda call: dispatch(registry, *call), calls))
+
+
 def _find_spec(registry: ToolRegistry, name: str) -> ToolSpec | None:
     for spec in registry or []:
         if spec.name == name:
@@ -295,7 +318,7 @@ def handle_search_topics(args: dict) -> ToolEnvelope:
     if not fused:
         return ToolEnvelope(
             summary="",
-            full=json.dumps([], ensure_ascii=False),
+            full=dumps_payload([]),
             metadata={"kind": "search", "source": "hybrid", "count": 0,
                       "total_match": len(bm25_ranking),
                       **({"warnings": warnings} if warnings else {})},
@@ -328,7 +351,7 @@ def handle_search_topics(args: dict) -> ToolEnvelope:
 
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False),
+        full=dumps_payload(payload),
         metadata=metadata,
         provenance={"query": query, "knesset_num": knesset_num, "top_k": top_k},
     )
@@ -464,7 +487,7 @@ def handle_search_protocols_keyword(args: dict) -> ToolEnvelope:
 
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False),
+        full=dumps_payload(payload),
         metadata=metadata,
         provenance={
             "query":       query,
@@ -550,7 +573,7 @@ def handle_find_mk(args: dict) -> ToolEnvelope:
 
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False),
+        full=dumps_payload(payload),
         metadata=metadata,
         provenance={"query": query, "knesset_num": knesset_num, "top_k": top_k},
     )
@@ -618,7 +641,7 @@ def handle_find_party(args: dict) -> ToolEnvelope:
     summary_parts = [f"{r['party']} ({r['mk_count']} ח\"כ)" for r in results]
     return ToolEnvelope(
         summary=f"מפלגות: {', '.join(summary_parts)}",
-        full=json.dumps(results, ensure_ascii=False),
+        full=dumps_payload(results),
         metadata={"kind": "search", "source": "parties", "count": len(results)},
         provenance={"query": query, "knesset_num": knesset_num},
     )
@@ -687,26 +710,18 @@ def _generic_find(
 
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False),
+        full=dumps_payload(payload),
         metadata=metadata,
         provenance={"query": query, "knesset_num": knesset_num, "top_k": top_k},
     )
 
 
 def _fetch_mk_record(mk_id: str) -> dict | None:
-    """Look up an MK by id by walking the cached members lists."""
-    from utils.knesset_db import _fetch_members
-    target = str(mk_id)
-    for is_current in (True, False):
-        try:
-            members = _fetch_members(is_current)
-        except Exception:
-            continue
-        for mk in members:
-            if str(mk.get("mk_individual_id") or "") == target or \
-               str(mk.get("PersonID") or "") == target:
-                return mk
-    return None
+    """Look up an MK by id in the cached members lookup."""
+    try:
+        return get_mk_by_id(mk_id)
+    except Exception:
+        return None
 
 
 def _fetch_bill_record(bill_id: str) -> dict | None:
@@ -720,15 +735,14 @@ def _fetch_bill_record(bill_id: str) -> dict | None:
 def _fetch_vote_record(vote_id: str) -> dict | None:
     """Best-effort vote-by-id fetch via OData KNS_PlenumVote."""
     try:
-        import requests
-        r = requests.get(
+        r = _retry_get(
             f"{config.OFFICIAL_KNESSET_NEW_API}/KNS_PlenumVote({int(vote_id)})",
             timeout=config.API_TIMEOUT,
         )
         if r.status_code == 404:
             return None
         r.raise_for_status()
-        return r.json()
+        return _json(r)
     except Exception:
         return None
 
@@ -755,7 +769,7 @@ def handle_get_mk_profile(args: dict) -> ToolEnvelope:
         )
     return ToolEnvelope(
         summary="",
-        full=json.dumps(record, ensure_ascii=False, default=str),
+        full=dumps_payload(record),
         metadata={"kind": "fetch", "source": "oknesset", "count": 1},
         provenance={"mk_id": mk_id, "knesset_num": knesset_num},
     )
@@ -789,7 +803,7 @@ def handle_get_mk_committees(args: dict) -> ToolEnvelope:
     }
     return ToolEnvelope(
         summary="",
-        full=json.dumps(payload, ensure_ascii=False, default=str),
+        full=dumps_payload(payload),
         metadata={"kind": "fetch", "source": "oknesset", "count": 1},
         provenance={"mk_id": mk_id, "knesset_num": knesset_num},
     )
@@ -853,7 +867,7 @@ def handle_get_bill_details(args: dict) -> ToolEnvelope:
         )
     return ToolEnvelope(
         summary="",
-        full=json.dumps(record, ensure_ascii=False, default=str),
+        full=dumps_payload(record),
         metadata={"kind": "fetch", "source": "odata", "count": 1},
         provenance={"bill_id": bill_id, "knesset_num": knesset_num},
     )
@@ -892,7 +906,7 @@ def handle_get_bill_text(args: dict) -> ToolEnvelope:
     warnings = ["result_truncated_to_%d_chars" % max_chars] if record.get("truncated") else []
     return ToolEnvelope(
         summary="",
-        full=json.dumps(record, ensure_ascii=False, default=str),
+        full=dumps_payload(record),
         metadata={
             "kind":   "fetch",
             "source": "odata",
@@ -1003,7 +1017,7 @@ def handle_get_meeting_summary(args: dict) -> ToolEnvelope:
 
     return ToolEnvelope(
         summary="",
-        full=payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False),
+        full=payload if isinstance(payload, str) else dumps_payload(payload),
         metadata={"kind": "fetch", "source": "summaries", "count": 1},
         provenance={
             "meeting_id":  meeting_id,
@@ -1099,7 +1113,7 @@ def handle_deep_dive_meeting(args: dict) -> ToolEnvelope:
     if not isinstance(envelope, ToolEnvelope):
         return ToolEnvelope(
             summary="",
-            full=json.dumps(envelope, ensure_ascii=False, default=str)
+            full=dumps_payload(envelope)
                  if envelope is not None else "",
             metadata={"kind": "analysis", "source": "deep_dive", "count": 0},
             provenance={"meeting_id": meeting_id, "mode": mode},
@@ -1148,6 +1162,7 @@ __all__ = [
     "ToolSpec",
     "ToolRegistry",
     "dispatch",
+    "dispatch_many",
     # search
     "handle_search_topics",
     "handle_search_protocols_keyword",
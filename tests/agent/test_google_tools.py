@@ -0,0 +1,56 @@
+"""Tests for agent.llm.google — memoized tool-schema conversion."""
+
+import gc
+
+import pytest
+
+from agent.llm import google
+
+
+def _tools(name: str = "get_mk_profile") -> list[dict]:
+    return [{"type": "function", "function": {
+        "name": name, "description": "d",
+        "parameters": {"type": "object", "properties": {"name": {"type": "string"}}},
+    }}]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(google, "_GENAI_TOOLS_CACHE", {})
+
+
+class TestGenaiTools:
+    def test_same_list_reuses_conversion(self, monkeypatch):
+        tools = _tools()
+        first = google._genai_tools(tools)
+        monkeypatch.setattr(google, "_convert_tools_genai", None)  # would raise if re-converted
+        assert google._genai_tools(tools) is first
+
+    def test_new_list_at_reused_id_is_reconverted(self):
+        tools = _tools("new")
+        # An entry under this list's id but for another list — as if a freed list's id were reused
+        stale = google._convert_tools_genai(_tools("stale"))
+        google._GENAI_TOOLS_CACHE[id(tools)] = ([], stale)
+        converted = google._genai_tools(tools)
+        assert converted is not stale
+        assert converted[0].function_declarations[0].name == "new"
+
+    def test_cached_list_keeps_its_id(self):
+        google._genai_tools(_tools("old"))
+        gc.collect()
+        (cached_list, _converted), = google._GENAI_TOOLS_CACHE.values()
+        assert cached_list[0]["function"]["name"] == "old"  # still alive, id not reusable
+
+    def test_cache_is_bounded(self):
+        lists = [_tools(f"t{i}") for i in range(google._GENAI_TOOLS_CACHE_SIZE + 5)]
+        for tools in lists:
+            google._genai_tools(tools)
+        assert len(google._GENAI_TOOLS_CACHE) == google._GENAI_TOOLS_CACHE_SIZE
+        assert id(lists[-1]) in google._GENAI_TOOLS_CACHE
+        assert id(lists[0]) not in google._GENAI_TOOLS_CACHE
+
+    def test_repeat_of_cached_list_does_not_evict(self):
+        lists = [_tools(f"t{i}") for i in range(google._GENAI_TOOLS_CACHE_SIZE)]
+        for tools in lists + lists:
+            google._genai_tools(tools)
+        assert set(google._GENAI_TOOLS_CACHE) == {id(t) for t in lists}
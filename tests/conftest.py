@@ -4,7 +4,9 @@ conftest.py
 Shared pytest fixtures and helpers.
 """
 
+import atexit
 import json
+import shutil
 import sys
 import tempfile
 from pathlib import Path
@@ -14,6 +16,18 @@ import pytest
 # Bootstrap sys.path so tests can import from src/ without installation
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import config  # noqa: E402
+
+# utils.knesset_db opens its sqlite HTTP cache at import time, and the member /
+# bill caches write under Data/ — point all of them at a throwaway directory
+# before any test module imports it, so test runs never touch the real cache.
+_TEST_CACHE_DIR = Path(tempfile.mkdtemp(prefix="knesset-lm-tests-"))
+atexit.register(shutil.rmtree, _TEST_CACHE_DIR, ignore_errors=True)
+config.CACHE_DB            = _TEST_CACHE_DIR / "knesset_api_cache"
+config.KNESSET_DB_CACHE_DB = _TEST_CACHE_DIR / "knesset_db_http_cache"
+config.MEMBERS_CACHE_DIR   = _TEST_CACHE_DIR / "members_cache"
+config.BILL_DOCS_CACHE_DIR = _TEST_CACHE_DIR / "bill_docs_cache"
+
 
 # ── Machine JSON factories ────────────────────────────────────────────────────
 
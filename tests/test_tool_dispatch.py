@@ -5,13 +5,14 @@ Tests for utils.tools.dispatch and related tool infrastructure.
 """
 
 import sys
+import threading
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pytest
 import config
-from utils.tools import ToolSpec, ToolRegistry, dispatch, handle_find_mk
+from utils.tools import ToolSpec, ToolRegistry, dispatch, dispatch_many, handle_find_mk
 from agent.subgraph.evidence import ToolEnvelope
 
 
@@ -153,6 +154,39 @@ class TestDispatchSuccess:
         assert isinstance(received_args.get("got"), dict)
 
 
+# ── dispatch_many ─────────────────────────────────────────────────────────────
+
+class TestDispatchMany:
+    def test_results_in_call_order(self):
+        registry = _make_registry(_make_spec("a", _make_ok_handler("A")),
+                                  _make_spec("b", _make_ok_handler("B")))
+        results = dispatch_many(registry, [("b", {}), ("a", {}), ("b", {})])
+        assert [r.full for r in results] == ["B", "A", "B"]
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def waiting_handler(args: dict) -> ToolEnvelope:
+            barrier.wait()  # deadlocks (→ BrokenBarrierError) if run one at a time
+            return _make_ok_handler(args["n"])(args)
+
+        registry = _make_registry(_make_spec("wait", waiting_handler))
+        results = dispatch_many(registry, [("wait", {"n": 1}), ("wait", {"n": 2})])
+        assert [r.error for r in results] == [None, None]
+        assert [r.full for r in results] == ["1", "2"]
+
+    def test_failures_stay_per_call(self):
+        def bad(args: dict) -> ToolEnvelope:
+            raise RuntimeError("boom")
+
+        registry = _make_registry(_make_spec("ok"), _make_spec("bad", handler=bad))
+        results = dispatch_many(registry, [("ok", {}), ("bad", {}), ("missing", {})])
+        assert [r.error for r in results] == [None, "dispatch_exception", "unknown_tool"]
+
+    def test_empty(self):
+        assert dispatch_many(_make_registry(), []) == []
+
+
 # ── dispatch: find_mk with real BM25 db ──────────────────────────────────────
 
 class TestDispatchFindMkNoDB:
@@ -0,0 +1,38 @@
+"""Tests for utils.tool_helpers.adapters — envelope wrappers (no network)."""
+
+import pytest
+
+from utils.tool_helpers import adapters
+
+
+# ── adapt_get_committee_sessions ──────────────────────────────────────────────
+
+class TestAdaptGetCommitteeSessions:
+    @pytest.fixture(autouse=True)
+    def sessions(self, monkeypatch):
+        """Record get_committee_sessions calls instead of querying OData."""
+        calls: list[dict] = []
+
+        def _fake(committee_id, **kwargs):
+            calls.append({"committee_id": committee_id, **kwargs})
+            return []
+
+        monkeypatch.setattr(adapters, "get_committee_sessions", _fake)
+        return calls
+
+    @pytest.mark.parametrize("bounds", [
+        {"date_from": "last week"},
+        {"date_to": "2024-13"},
+        {"date_from": 2024},
+        {"date_to": ["2024"]},
+    ])
+    def test_bad_dates_are_invalid_date_range(self, bounds, sessions):
+        env = adapters.adapt_get_committee_sessions(committee_id="7", **bounds)
+        assert env.error == "invalid_date_range"
+        assert sessions == []
+
+    def test_valid_range_is_passed_through(self, sessions):
+        env = adapters.adapt_get_committee_sessions(committee_id="7", date_from="2024-01", date_to="2024")
+        assert env.error is None
+        assert sessions == [{"committee_id": 7, "knesset_num": 25,
+                             "date_from": "2024-01", "date_to": "2024"}]
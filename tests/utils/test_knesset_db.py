@@ -0,0 +1,752 @@
+"""Tests for utils.knesset_db — member aggregation and name search (no network)."""
+
+import copy
+import json
+import time
+from functools import lru_cache
+
+import pytest
+import requests
+
+import config
+from utils import knesset_db
+from utils.knesset_db import (
+    _bill_search_terms,
+    _extract_pdf_text,
+    _fuzzy_candidates,
+    _most_recent_faction,
+    _name_choices,
+    _name_word_index,
+    _norm_name,
+    _odata_date_bound,
+    _search_mks_by_name,
+    _substring_candidates,
+    get_all_mks,
+    get_all_parties,
+    get_members_for_committees,
+    get_mk_by_id,
+    get_mk_profile,
+    get_party_members,
+)
+
+
+def _faction(name: str, start: str, knesset: int = 25) -> dict:
+    return {"faction_name": name, "start_date": start, "knesset": knesset}
+
+
+def _mk(mk_id: int, first: str, last: str, factions: list, **extra) -> dict:
+    return {
+        "mk_individual_id":         mk_id,
+        "mk_individual_first_name": first,
+        "mk_individual_name":       last,
+        "factions":                 factions,
+        **extra,
+    }
+
+
+CURRENT = [
+    _mk(1, "יצחק", "לוי", [_faction("הליכוד ", "2022-11-15")], IsCurrent=True,
+        altnames=["איציק לוי"]),
+    _mk(2, "שרה", "כהן", [
+        _faction("יש עתיד", "2022-11-15"),
+        _faction("המחנה הממלכתי", "2024-03-01"),
+    ], IsCurrent=True),
+    _mk(3, "דוד", "מזרחי", [_faction("הליכוד", "2022-11-15"), None], IsCurrent=True),
+]
+FORMER = [
+    _mk(4, "משה", "פרץ", [_faction("העבודה", "2019-04-30", knesset=21)], IsCurrent=False),
+    _mk(5, "רחל", "אברהם", [_faction("יש עתיד", "2022-11-15")], IsCurrent=False,
+        PersonID=905),
+]
+
+
+_real_fetch_members = knesset_db._fetch_members
+
+
+@pytest.fixture(autouse=True)
+def fake_members(monkeypatch):
+    """Serve fixed member lists instead of hitting backend.oknesset.org.
+
+    Returns the list of ``is_current`` values actually fetched.
+    """
+    current, former = copy.deepcopy(CURRENT), copy.deepcopy(FORMER)
+    fetched: list[bool] = []
+
+    @lru_cache(maxsize=2)
+    def _fake_fetch(is_current: bool) -> list[dict]:
+        fetched.append(is_current)
+        return current if is_current else former
+
+    knesset_db.clear_caches()
+    monkeypatch.setattr(knesset_db, "_fetch_members", _fake_fetch)
+    yield fetched
+    knesset_db.clear_caches()
+
+
+# ── fake HTTP ─────────────────────────────────────────────────────────────────
+
+class _FakeResponse:
+    """A requests.Response stand-in: JSON (or raw bytes) body, status, headers."""
+
+    def __init__(self, status_code: int, body=None, etag: str | None = None,
+                 headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+        self.headers.update(headers or {})
+        if isinstance(body, bytes):
+            self.content = body
+        else:
+            self.content = json.dumps(body).encode() if body is not None else b""
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _FakeApi:
+    """
+    Stand-in for knesset_db._SESSION.get, so requests still pass through
+    _retry_get. Responses are routed by the URL's last path segment (the
+    OData entity or file name; "*" matches anything). A route is a
+    _FakeResponse, a JSON body for a 200, or a callable (url, params) → either.
+    Every request is recorded in `calls` as (url, params, kwargs).
+    """
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict | None, dict]] = []
+        self.routes: dict[str, object] = {}
+
+    def route(self, entity: str, response) -> None:
+        self.routes[entity] = response
+
+    @property
+    def entities(self) -> list[str]:
+        return [url.rsplit("/", 1)[-1] for url, _params, _kwargs in self.calls]
+
+    @property
+    def params(self) -> list[dict | None]:
+        return [params for _url, params, _kwargs in self.calls]
+
+    def __call__(self, url, params=None, **kwargs):
+        self.calls.append((url, params, kwargs))
+        entity = url.rsplit("/", 1)[-1]
+        if entity not in self.routes and "*" not in self.routes:
+            raise AssertionError(f"unexpected request: {url}")
+        response = self.routes.get(entity, self.routes.get("*"))
+        if callable(response):
+            response = response(url, params)
+        return response if isinstance(response, _FakeResponse) else _FakeResponse(200, response)
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Serve HTTP from a _FakeApi (no retry sleeps); returns it for routing and inspection."""
+    api = _FakeApi()
+    monkeypatch.setattr(config, "API_RETRY_SLEEP", 0)
+    monkeypatch.setattr(knesset_db._SESSION, "get", api)
+    return api
+
+
+# ── get_all_mks ───────────────────────────────────────────────────────────────
+
+class TestGetAllMks:
+    def test_sorted_by_last_name(self):
+        assert [mk["mk_individual_name"] for mk in get_all_mks(25)] == ["אברהם", "כהן", "לוי", "מזרחי"]
+
+    def test_missing_last_name_sorts_first(self, fake_members):
+        knesset_db._fetch_members(True)[2]["mk_individual_name"] = None
+        knesset_db._members_by_knesset.cache_clear()
+        assert get_all_mks(25)[0]["mk_individual_id"] == 3
+
+
+# ── get_all_parties ───────────────────────────────────────────────────────────
+
+class TestGetAllParties:
+    def test_counts_most_recent_faction(self):
+        parties = {p["party"]: p["mk_count"] for p in get_all_parties(25)}
+        assert parties == {"הליכוד": 2, "המחנה הממלכתי": 1, "יש עתיד": 1}
+
+    def test_sorted_by_count_descending(self):
+        counts = [p["mk_count"] for p in get_all_parties(25)]
+        assert counts == sorted(counts, reverse=True)
+
+    def test_other_knesset_only(self):
+        assert get_all_parties(21) == [{"party": "העבודה", "mk_count": 1}]
+
+    def test_unknown_knesset_is_empty(self):
+        assert get_all_parties(99) == []
+
+
+# ── _get_all_members_raw ──────────────────────────────────────────────────────
+
+class TestMembersByKnesset:
+    def test_bucket_keeps_member_order(self):
+        assert [mk["mk_individual_id"] for mk in knesset_db._get_all_members_raw(25)] == [1, 2, 3, 5]
+
+    def test_member_listed_once_per_knesset(self, fake_members):
+        current = knesset_db._fetch_members(True)
+        current[1]["factions"].append(_faction("יש עתיד", "2019-04-30", knesset=21))
+        knesset_db._members_by_knesset.cache_clear()
+        assert [mk["mk_individual_id"] for mk in knesset_db._get_all_members_raw(21)] == [2, 4]
+        assert [mk["mk_individual_id"] for mk in knesset_db._get_all_members_raw(25)].count(2) == 1
+
+    def test_none_means_all_members(self):
+        assert len(knesset_db._get_all_members_raw(None)) == len(CURRENT) + len(FORMER)
+
+
+# ── _most_recent_faction ──────────────────────────────────────────────────────
+
+class TestMostRecentFaction:
+    FACTIONS = [None, _faction("א", "2019-04-30", knesset=21),
+                _faction("ב", "2022-11-15"), _faction("ג", "2024-03-01"), {}]
+
+    def test_latest_in_knesset(self):
+        assert _most_recent_faction(self.FACTIONS, 21)["faction_name"] == "א"
+
+    def test_none_means_any_knesset(self):
+        assert _most_recent_faction(self.FACTIONS, None)["faction_name"] == "ג"
+
+    def test_no_faction_in_knesset(self):
+        assert _most_recent_faction(self.FACTIONS, 20) is None
+
+
+# ── member cache TTL / ETag refresh ───────────────────────────────────────────
+
+class TestMembersCacheTtl:
+    def test_fresh_cache_is_reused(self, fake_members):
+        get_all_parties(25)
+        get_all_parties(25)
+        assert sorted(fake_members) == [False, True]
+
+    def test_stale_cache_is_refetched(self, fake_members, monkeypatch):
+        get_all_parties(25)
+        monkeypatch.setattr(
+            knesset_db, "_members_fetched_at",
+            time.monotonic() - config.MEMBERS_CACHE_TTL - 1,
+        )
+        get_all_parties(25)
+        assert sorted(fake_members) == [False, False, True, True]
+
+    @pytest.fixture
+    def api(self, fake_api, monkeypatch, tmp_path):
+        """Queue of responses served to _fetch_members, and the headers sent with each."""
+        responses: list[_FakeResponse] = []
+        fake_api.route("members", lambda url, params: responses.pop(0))
+        monkeypatch.setattr(knesset_db, "_members_validators", {})
+        monkeypatch.setattr(config, "MEMBERS_CACHE_DIR", tmp_path / "members_cache")
+        return responses, lambda: [kwargs.get("headers") or {} for _u, _p, kwargs in fake_api.calls]
+
+    def test_refresh_sends_etag_and_reuses_body_on_304(self, api):
+        responses, sent_headers = api
+        responses += [_FakeResponse(200, [{"mk_individual_id": 1}], etag='"v1"'),
+                      _FakeResponse(304)]
+        fetch = _real_fetch_members.__wrapped__
+        first = fetch(True)
+        assert fetch(True) is first
+        assert sent_headers() == [{}, {"If-None-Match": '"v1"'}]
+
+    def test_new_process_revalidates_from_disk(self, api, monkeypatch):
+        responses, sent_headers = api
+        responses += [_FakeResponse(200, [{"mk_individual_id": 1}], etag='"v1"'),
+                      _FakeResponse(304)]
+        fetch = _real_fetch_members.__wrapped__
+        fetch(False)
+        monkeypatch.setattr(knesset_db, "_members_validators", {})  # as if restarted
+        assert fetch(False) == [{"mk_individual_id": 1}]
+        assert sent_headers()[-1] == {"If-None-Match": '"v1"'}
+
+    def test_corrupt_disk_cache_is_ignored(self, api):
+        responses, sent_headers = api
+        config.MEMBERS_CACHE_DIR.mkdir()
+        (config.MEMBERS_CACHE_DIR / "members_current.json").write_text("{not json")
+        responses.append(_FakeResponse(200, [], etag='"v2"'))
+        assert _real_fetch_members.__wrapped__(True) == []
+        assert sent_headers() == [{}]
+
+
+# ── _retry_get ────────────────────────────────────────────────────────────────
+
+class TestRetryGet:
+    @pytest.fixture
+    def statuses(self, fake_api):
+        queue: list[int] = []
+        fake_api.route("*", lambda url, params: _FakeResponse(queue.pop(0), {}))
+        return queue
+
+    def test_rate_limit_is_retried(self, statuses):
+        statuses.extend([429, 200])
+        assert knesset_db._retry_get("https://x").status_code == 200
+
+    def test_other_4xx_returned_as_is(self, statuses):
+        statuses.extend([404, 200])
+        assert knesset_db._retry_get("https://x").status_code == 404
+
+
+# ── get_party_members ─────────────────────────────────────────────────────────
+
+class TestGetPartyMembers:
+    def test_members_of_best_match(self):
+        top = get_party_members("ליכוד", 25, top_k=1)[0]
+        assert top["party"] == "הליכוד"
+        assert [m["full_name"] for m in top["members"]] == ["דוד מזרחי", "יצחק לוי"]
+
+    def test_uses_most_recent_faction(self):
+        top = get_party_members("יש עתיד", 25, top_k=1)[0]
+        # שרה כהן moved to המחנה הממלכתי later in the same Knesset
+        assert [m["mk_id"] for m in top["members"]] == ["5"]
+
+    def test_roster_built_once(self, monkeypatch):
+        get_party_members("ליכוד", 25)
+        monkeypatch.setattr(knesset_db, "_most_recent_faction", None)  # would raise if re-walked
+        assert get_party_members("יש עתיד", 25, top_k=1)[0]["mk_count"] == 1
+
+    def test_caller_mutation_does_not_leak(self):
+        get_party_members("ליכוד", 25, top_k=1)[0]["members"][0]["full_name"] = "x"
+        assert get_party_members("ליכוד", 25, top_k=1)[0]["members"][0]["full_name"] == "דוד מזרחי"
+
+
+# ── _search_mks_by_name ───────────────────────────────────────────────────────
+
+def _ids(mks: list[dict]) -> list[int]:
+    return [mk["mk_individual_id"] for mk in mks]
+
+
+class TestSearchMksByName:
+    def test_full_name(self):
+        assert _ids(_search_mks_by_name("יצחק לוי")) == [1]
+
+    def test_reversed_order(self):
+        assert _ids(_search_mks_by_name("לוי יצחק")) == [1]
+
+    def test_partial_name(self):
+        assert _ids(_search_mks_by_name("כהן")) == [2]
+
+    def test_name_inside_longer_query(self):
+        assert _ids(_search_mks_by_name('ח"כ שרה כהן')) == [2]
+
+    def test_altname(self):
+        assert _ids(_search_mks_by_name("איציק")) == [1]
+
+    def test_former_members_included_after_current(self):
+        assert _ids(_search_mks_by_name("רחל אברהם")) == [5]
+
+    def test_niqqud_and_gershayim_ignored(self):
+        assert _ids(_search_mks_by_name("ח״כ שָׂרָה כֹּהֵן")) == [2]
+
+    def test_typo_falls_back_to_fuzzy(self):
+        assert _ids(_search_mks_by_name("שרה כחן")) == [2]
+
+    def test_no_match(self):
+        assert _search_mks_by_name("ישראל ישראלי") == []
+
+    @pytest.mark.parametrize("query", ["", "  ", "12345", "?!", "John Smith"])
+    def test_query_outside_name_alphabet_rejected(self, query, monkeypatch):
+        monkeypatch.setattr(knesset_db, "_substring_candidates", None)  # would raise if scanned
+        assert _search_mks_by_name(query) == []
+
+    def test_stray_digit_still_matches(self):
+        assert _ids(_search_mks_by_name("שרה כהן 2")) == [2]
+
+
+# ── get_mk_profile ────────────────────────────────────────────────────────────
+
+class TestGetMkProfile:
+    def test_single_match(self):
+        profile = get_mk_profile("יצחק לוי")
+        assert profile["mk_individual_id"] == 1
+        assert profile["multiple_matches"] is False
+        assert "other_matches" not in profile
+
+    def test_other_matches_named(self):
+        profile = get_mk_profile("יצחק לוי ודוד מזרחי")  # both names sit inside the query
+        assert profile["mk_individual_id"] == 1
+        assert profile["multiple_matches"] is True
+        assert profile["other_matches"] == ["דוד מזרחי"]
+
+    def test_cached_record_not_annotated(self):
+        get_mk_profile("שרה כהן")
+        assert "multiple_matches" not in get_mk_by_id(2)
+
+    def test_no_match(self):
+        assert get_mk_profile("12345") is None
+
+
+class TestSubstringCandidates:
+    @pytest.fixture(params=[True, False], ids=["ahocorasick", "fingerprints"], autouse=True)
+    def matcher(self, request, monkeypatch):
+        if request.param and not knesset_db._AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(knesset_db, "_AHOCORASICK_AVAILABLE", request.param)
+        knesset_db._name_automaton.cache_clear()
+        yield
+        knesset_db._name_automaton.cache_clear()
+
+    @pytest.mark.parametrize("query", [
+        "לוי", "יצחק לוי", "לוי יצחק", 'ח"כ שרה כהן', "איציק", "ח", "ם", "רחל", "xyz",
+    ])
+    def test_never_drops_a_substring_match(self, query):
+        q = _norm_name(query)
+        choices, _ = _name_choices()
+        expected = {i for i, n in enumerate(choices) if q in n or n in q}
+        assert expected <= set(_substring_candidates(q))
+
+    def test_narrows_the_scan(self):
+        choices, _ = _name_choices()
+        assert len(_substring_candidates("מזרחי")) < len(choices)
+
+    def test_no_letters_means_full_scan(self):
+        assert _substring_candidates("-- 12") is None
+
+
+class TestFuzzyCandidates:
+    def test_index_aligned_with_choices(self):
+        by_word, _ = _name_word_index()
+        choices, _ = _name_choices()
+        for word, indices in by_word.items():
+            assert all(word in choices[i] for i in indices)
+
+    def test_one_edit_typo_narrows_to_owner(self):
+        choices, owners = _name_choices()
+        pool = _fuzzy_candidates("שרה כחן")
+        assert pool and len(pool) < len(choices)
+        assert {owners[i]["mk_individual_id"] for i in pool} == {2}
+
+    def test_noise_word_does_not_veto(self):
+        _, owners = _name_choices()
+        assert {owners[i]["mk_individual_id"] for i in _fuzzy_candidates("פרופסור מזרחי")} == {3}
+
+    def test_no_survivors_means_full_scan(self):
+        assert _fuzzy_candidates("קקקקק") is None
+
+
+# ── get_mk_by_id ──────────────────────────────────────────────────────────────
+
+class TestGetMkById:
+    def test_by_mk_individual_id(self):
+        assert get_mk_by_id("3")["mk_individual_name"] == "מזרחי"
+
+    def test_by_person_id_int(self):
+        assert get_mk_by_id(905)["mk_individual_id"] == 5
+
+    def test_unknown_id(self):
+        assert get_mk_by_id("999") is None
+
+
+# ── _search_committees_by_name ────────────────────────────────────────────────
+
+class TestSearchCommitteesByName:
+    ROWS = [
+        {"Id": 1, "Name": "ועדת הכספים המשותפת", "KnessetNum": 25, "IsCurrent": True},
+        {"Id": 2, "Name": "ועדת הכספים", "KnessetNum": 25, "IsCurrent": True},
+        {"Id": 3, "Name": "תת-ועדת הכספים", "KnessetNum": 25, "IsCurrent": False},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def committees(self, fake_api):
+        fake_api.route("KNS_Committee", {"value": self.ROWS})
+
+    def test_filter_pushed_down(self, fake_api):
+        knesset_db._search_committees_by_name("הכספים", 25)
+        assert fake_api.params[0]["$filter"] == "contains(Name,'הכספים') and KnessetNum eq 25"
+        assert fake_api.params[0]["$select"] == "Id,Name,KnessetNum,IsCurrent"
+
+    def test_exact_match_first_then_shorter(self):
+        found = knesset_db._search_committees_by_name(" ועדת הכספים ", 25)
+        assert [c["CommitteeID"] for c in found] == [2, 3, 1]
+        assert set(found[0]) == {"CommitteeID", "Name", "KnessetNum", "IsCurrent"}
+
+
+# ── get_committee_members ─────────────────────────────────────────────────────
+
+def _position_row(person_id: int, last: str, duty: str, committee_id: int = 7) -> dict:
+    return {"PersonID": person_id, "DutyDesc": duty, "CommitteeID": committee_id,
+            "KNS_Person": {"FirstName": "ח", "LastName": last}}
+
+
+class TestGetCommitteeMembers:
+    @pytest.fixture
+    def api(self, fake_api):
+        """
+        Serve the by-name probe from `by_name` and the two-call path otherwise;
+        returns (labels of the requests made, by_name).
+        """
+        by_name = {"status": 200, "rows": [_position_row(1, "כהן", 'יו"ר הוועדה'),
+                                           _position_row(1, "כהן", "חבר הוועדה"),
+                                           _position_row(2, "לוי", 'מ"מ חבר'),
+                                           _position_row(3, "אבן", "חברת הוועדה"),
+                                           _position_row(4, "זר", "חבר", committee_id=8)]}
+
+        def _positions(url, params):
+            if "KNS_Committee/Name" in params["$filter"]:
+                return _FakeResponse(by_name["status"], {"value": by_name["rows"]})
+            return {"value": [_position_row(5, "פרץ", "חבר")]}
+
+        fake_api.route("KNS_PersonToPosition", _positions)
+        fake_api.route("KNS_Committee", {"value": [{"Id": 7, "Name": "ועדת הכספים"}]})
+
+        def _labels() -> list[str]:
+            return ["by_name" if "KNS_Committee/Name" in params["$filter"] else entity
+                    for entity, params in zip(fake_api.entities, fake_api.params)]
+
+        return _labels, by_name
+
+    def test_exact_name_is_one_request(self, api):
+        calls, _ = api
+        members = knesset_db.get_committee_members("ועדת הכספים")
+        assert calls() == ["by_name"]
+        assert [(m["mk_id"], m["duty_desc"]) for m in members] == [
+            (3, "חברת הוועדה"), (1, 'יו"ר הוועדה'),
+        ]
+
+    def test_no_exact_match_falls_back_to_lookup(self, api):
+        calls, by_name = api
+        by_name["rows"] = []
+        assert [m["mk_id"] for m in knesset_db.get_committee_members("ועדת כספים")] == [5]
+        assert calls() == ["by_name", "KNS_Committee", "KNS_PersonToPosition"]
+
+    def test_partial_name_skips_exact_probe(self, api):
+        calls, _ = api
+        assert [m["mk_id"] for m in knesset_db.get_committee_members("כספים")] == [5]
+        assert calls() == ["KNS_Committee", "KNS_PersonToPosition"]
+
+    def test_rejected_navigation_filter_falls_back(self, api):
+        calls, by_name = api
+        by_name["status"] = 400
+        assert [m["mk_id"] for m in knesset_db.get_committee_members("ועדת הכספים")] == [5]
+        assert calls()[1:] == ["KNS_Committee", "KNS_PersonToPosition"]
+
+    def test_server_error_on_probe_falls_back_without_retry(self, api):
+        calls, by_name = api
+        by_name["status"] = 500
+        assert [m["mk_id"] for m in knesset_db.get_committee_members("ועדת הכספים")] == [5]
+        assert calls() == ["by_name", "KNS_Committee", "KNS_PersonToPosition"]
+
+    def test_probe_timeout_falls_back(self, api, fake_api):
+        calls, _ = api
+        positions = fake_api.routes["KNS_PersonToPosition"]
+
+        def _timeout_by_name(url, params):
+            if "KNS_Committee/Name" in params["$filter"]:
+                raise requests.exceptions.Timeout("read timed out")
+            return positions(url, params)
+
+        fake_api.route("KNS_PersonToPosition", _timeout_by_name)
+        assert [m["mk_id"] for m in knesset_db.get_committee_members("ועדת הכספים")] == [5]
+        assert calls()[1:] == ["KNS_Committee", "KNS_PersonToPosition"]
+
+
+# ── get_members_for_committees ────────────────────────────────────────────────
+
+class TestGetMembersForCommittees:
+    @staticmethod
+    def _positions(url, params):
+        cid = int(params["$filter"].split()[2])
+        return {"value": [{"PersonID": cid * 10, "DutyDesc": "חבר",
+                           "KNS_Person": {"FirstName": "ח", "LastName": str(cid)}}]}
+
+    def test_keyed_by_committee_in_order(self, fake_api):
+        fake_api.route("KNS_PersonToPosition", self._positions)
+        result = get_members_for_committees([7, 3, 7], knesset_num=25)
+        assert list(result) == [7, 3]
+        assert [m["mk_id"] for m in result[3]] == [30]
+
+    def test_empty(self):
+        assert get_members_for_committees([]) == {}
+
+
+# ── OData string quoting ──────────────────────────────────────────────────────
+
+class TestOdataQuoting:
+    def test_search_terms_are_not_pre_escaped(self):
+        assert _bill_search_terms("חוק צ'יפס") == ["חוק צ'יפס", "צ'יפס"]
+
+    def test_bill_filter_escapes_quote_once(self, fake_api):
+        fake_api.route("KNS_Bill", {"value": []})
+        knesset_db._search_bills_by_term("צ'יפס", knesset_num=25)
+        assert fake_api.params[0]["$filter"] == "contains(Name,'צ''יפס') and KnessetNum eq 25"
+
+    def test_mk_name_filter(self):
+        mk = {"mk_individual_name": "צ'רניחובסקי", "mk_individual_first_name": "שאול"}
+        assert knesset_db._mk_name_filter(mk) == "LastName eq 'צ''רניחובסקי' and FirstName eq 'שאול'"
+
+
+# ── _odata_date_bound ─────────────────────────────────────────────────────────
+
+class TestOdataDateBound:
+    def test_full_date_lower(self):
+        assert _odata_date_bound("2024-03-05") == "2024-03-05T00:00:00Z"
+
+    def test_full_date_upper_is_next_day(self):
+        assert _odata_date_bound("2024-02-29", upper=True) == "2024-03-01T00:00:00Z"
+
+    def test_month_upper_wraps_year(self):
+        assert _odata_date_bound("2024-12", upper=True) == "2025-01-01T00:00:00Z"
+
+    def test_year_lower(self):
+        assert _odata_date_bound("2024") == "2024-01-01T00:00:00Z"
+
+    def test_malformed_raises(self):
+        with pytest.raises(ValueError):
+            _odata_date_bound("last week")
+
+
+# ── _extract_pdf_text ─────────────────────────────────────────────────────────
+
+def _pdf(*pages: str) -> bytes:
+    import fitz
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+class TestExtractPdfText:
+    PDF = _pdf("first page text", "second page text", "third page text")
+
+    def test_all_pages_without_limit(self):
+        assert _extract_pdf_text(self.PDF).split() == "first page text second page text third page text".split()
+
+    def test_stops_after_max_chars(self):
+        text = _extract_pdf_text(self.PDF, max_chars=20)
+        assert "second" in text and "third" not in text
+        assert len(text) > 20  # still long enough for the caller to flag truncation
+
+    def test_pdfplumber_fallback_honours_limit(self, monkeypatch):
+        monkeypatch.setattr(knesset_db, "_extract_pdf_text_pymupdf",
+                            lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("boom")))
+        assert "third" not in _extract_pdf_text(self.PDF, max_chars=5)
+
+
+class TestExtractBillText:
+    URL = "https://fs.knesset.gov.il/25/law/bill.pdf"
+
+    @pytest.fixture
+    def downloads(self, fake_api, monkeypatch, tmp_path):
+        """Serve TestExtractPdfText.PDF; returns a callable listing the URLs downloaded."""
+        fake_api.route("bill.pdf", _FakeResponse(200, TestExtractPdfText.PDF))
+        monkeypatch.setattr(config, "BILL_DOCS_CACHE_DIR", tmp_path / "bill_docs")
+        return lambda: [url for url, _params, _kwargs in fake_api.calls]
+
+    def test_repeat_call_skips_download_and_parse(self, downloads, monkeypatch):
+        first = knesset_db._extract_bill_text(self.URL, 8000)
+        monkeypatch.setattr(knesset_db, "_extract_pdf_text", None)  # would raise if re-parsed
+        assert knesset_db._extract_bill_text(self.URL, 8000) == first
+        assert downloads() == [self.URL]
+
+    def test_one_text_file_serves_every_limit(self, downloads):
+        assert "third" in knesset_db._extract_bill_text(self.URL, 8000)
+        assert "third" in knesset_db._extract_bill_text(self.URL, 5)  # caller slices
+        assert downloads() == [self.URL]
+        assert [p.suffix for p in config.BILL_DOCS_CACHE_DIR.iterdir()] == [".txt"]
+
+    def test_expired_text_is_refetched(self, downloads, monkeypatch):
+        knesset_db._extract_bill_text(self.URL, 8000)
+        monkeypatch.setattr(config, "BILL_DOCS_CACHE_TTL", 0)
+        knesset_db._extract_bill_text(self.URL, 8000)
+        assert downloads() == [self.URL, self.URL]
+
+    def test_limit_beyond_cache_cap_bypasses_it(self, downloads, monkeypatch):
+        monkeypatch.setattr(config, "BILL_TEXT_MAX_MAX_CHARS", 5)
+        assert "third" not in knesset_db._extract_bill_text(self.URL, 5)
+        assert "third" in knesset_db._extract_bill_text(self.URL, 8000)
+        assert len(list(config.BILL_DOCS_CACHE_DIR.iterdir())) == 1
+
+    def test_oversized_pdf_is_rejected_uncached(self, downloads, monkeypatch):
+        monkeypatch.setattr(config, "BILL_DOC_MAX_BYTES", len(TestExtractPdfText.PDF) - 1)
+        with pytest.raises(ValueError):
+            knesset_db._extract_bill_text(self.URL, 8000)
+        assert not config.BILL_DOCS_CACHE_DIR.exists()
+
+
+# ── _download_document ────────────────────────────────────────────────────────
+
+class TestDownloadDocument:
+    LIMIT = 200_000
+
+    @pytest.fixture
+    def serve(self, fake_api):
+        """Serve `body` with optional headers; returns a setter."""
+        return lambda body, **headers: fake_api.route("x", _FakeResponse(200, body, headers=headers))
+
+    def test_body_under_cap(self, serve, fake_api):
+        serve(b"x" * 150_000)
+        assert knesset_db._download_document("https://x", self.LIMIT) == b"x" * 150_000
+        assert fake_api.calls[0][2]["stream"] is True
+
+    def test_declared_length_over_cap(self, serve):
+        serve(b"", **{"Content-Length": "300000"})
+        with pytest.raises(ValueError):
+            knesset_db._download_document("https://x", self.LIMIT)
+
+    def test_undeclared_body_over_cap(self, serve):
+        serve(b"x" * 300_000)
+        with pytest.raises(ValueError):
+            knesset_db._download_document("https://x", self.LIMIT)
+
+
+# ── _get_bill_documents ───────────────────────────────────────────────────────
+
+class TestGetBillDocuments:
+    def test_sorted_by_reading_priority(self, fake_api):
+        groups = ["חוק - פרסום ברשומות", "מסמך אחר", "הצעת חוק לקריאה הראשונה",
+                  "הצעת חוק לקריאה השנייה והשלישית"]
+        rows = [{"Id": i, "GroupTypeDesc": g, "ApplicationDesc": "PDF",
+                 "FilePath": f"https://fs.knesset.gov.il/{i}.pdf"}
+                for i, g in enumerate(groups)]
+        fake_api.route("KNS_DocumentBill", {"value": rows})
+        assert [d["doc_id"] for d in knesset_db._get_bill_documents(1)] == [3, 2, 0, 1]
+
+
+# ── _get_bill_details_by_id ───────────────────────────────────────────────────
+
+class TestGetBillDetailsById:
+    def test_unknown_bill_makes_no_side_requests(self, fake_api):
+        fake_api.route("KNS_Bill(42)", _FakeResponse(404))
+        assert knesset_db._get_bill_details_by_id(42) is None
+        assert fake_api.entities == ["KNS_Bill(42)"]
+
+    def test_known_bill_fetches_initiators_and_documents(self, fake_api):
+        fake_api.route("KNS_Bill(42)", {"Id": 42, "Name": "חוק", "KNS_Status": {"Desc": "אושר"}})
+        fake_api.route("KNS_BillInitiator", {"value": []})
+        fake_api.route("KNS_DocumentBill", {"value": []})
+        details = knesset_db._get_bill_details_by_id(42)
+        assert (details["bill_id"], details["status"]) == (42, "אושר")
+        assert details["initiators"] == [] and details["documents"] == []
+        assert sorted(fake_api.entities) == ["KNS_Bill(42)", "KNS_BillInitiator", "KNS_DocumentBill"]
+
+
+# ── _get_session_protocol_text ────────────────────────────────────────────────
+
+class TestGetSessionProtocolText:
+    @pytest.fixture(autouse=True)
+    def protocol(self, fake_api):
+        fake_api.route("KNS_DocumentCommitteeSession", {"value": [
+            {"Id": 1, "DocumentName": "פרוטוקול הישיבה", "ApplicationDesc": "PDF",
+             "FilePath": "https://fs.knesset.gov.il/protocol.pdf"},
+        ]})
+        fake_api.route("protocol.pdf", _FakeResponse(200, TestExtractPdfText.PDF))
+
+    def test_protocols_not_bound_by_bill_cap(self, monkeypatch):
+        monkeypatch.setattr(config, "BILL_DOC_MAX_BYTES", 1)
+        assert "third" in knesset_db._get_session_protocol_text(9)["text"]
+
+    def test_oversized_protocol_is_logged(self, monkeypatch, capsys):
+        monkeypatch.setattr(config, "PROTOCOL_DOC_MAX_BYTES", 1)
+        assert knesset_db._get_session_protocol_text(9) is None
+        assert "protocol.pdf" in capsys.readouterr().out
@@ -0,0 +1,56 @@
+"""Tests for utils.tool_helpers.serialize — JSON encoding/decoding."""
+
+import json
+from datetime import date
+
+import pytest
+
+from utils.tool_helpers import serialize
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """The serialize module, forced onto the orjson or the stdlib path."""
+    if request.param and not serialize._ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialize, "_ORJSON_AVAILABLE", request.param)
+    return serialize
+
+
+@pytest.fixture
+def dumps(codec):
+    return codec.dumps
+
+
+class TestDumps:
+    def test_hebrew_kept_as_text(self, dumps):
+        out = dumps({"name": "ועדת הכספים"})
+        assert "ועדת הכספים" in out
+        assert json.loads(out) == {"name": "ועדת הכספים"}
+
+    def test_unknown_types_become_strings(self, dumps):
+        assert json.loads(dumps({"ids": {3}})) == {"ids": "{3}"}
+
+    def test_dates_round_trip_as_iso(self, dumps):
+        assert json.loads(dumps([date(2024, 3, 5)])) == ["2024-03-05"]
+
+    def test_int_keys(self, dumps):
+        assert json.loads(dumps({7: "x"})) == {"7": "x"}
+
+    def test_huge_int_falls_back(self, dumps):
+        assert json.loads(dumps([2 ** 70])) == [2 ** 70]
+
+
+class TestBytesAndLoads:
+    def test_bytes_round_trip(self, codec):
+        payload = {"members": [{"name": "שרה כהן", "id": 2}], "validators": {}}
+        data = codec.dumps_bytes(payload)
+        assert isinstance(data, bytes) and "שרה".encode("utf-8") in data
+        assert codec.loads(data) == payload
+
+    def test_loads_str(self, codec):
+        assert codec.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_malformed_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")